@@ -2,6 +2,7 @@ from unirules.core.rules import RuleSet, RuleSetPolicy, RuleTree, RuleValue
 from unirules.domains.discrete.domain import DiscreteDomain
 from unirules.domains.interval.domain import IntervalDomain
 from unirules.dsl import field, otherwise, ruleset, when
+from unirules.engines._ctx_validation import ContextRecord
 from unirules.engines.analyzer import Analyzer, DiscreteAnalyzeResult, IntervalAnalyzeResult
 from unirules.engines.resolver import Explanation, Resolver
 from unirules.ruleset_loader import load_ruleset_from_code
@@ -23,6 +24,7 @@ __all__ = [
     # Resolver
     "Resolver",
     "Explanation",
+    "ContextRecord",
     # Analyzer
     "Analyzer",
     "DiscreteAnalyzeResult",
@@ -0,0 +1,63 @@
+"""
+Backport of ``dataclass(slots=True)`` for Python 3.9.
+
+``__slots__`` cannot be declared in the body of a dataclass whose fields have
+defaults (the default would clash with the slot descriptor), so the class is
+recreated with slots once :func:`dataclasses.dataclass` has processed it.
+This mirrors what the standard library does for ``slots=True`` on 3.10+.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any, TypeVar
+
+__all__ = ["add_slots"]
+
+T = TypeVar("T", bound=type)
+
+
+def _getstate(self: Any) -> list[Any]:
+    # Derived ``init=False`` fields may hold closures; rebuild them on load.
+    return [getattr(self, f.name) for f in fields(self) if f.init]
+
+
+def _setstate(self: Any, state: list[Any]) -> None:
+    for f, value in zip([f for f in fields(self) if f.init], state):
+        # Frozen dataclasses reject ``setattr``; bypass it like ``__init__`` does.
+        object.__setattr__(self, f.name, value)
+    post_init = getattr(self, "__post_init__", None)
+    if post_init is not None:
+        post_init()
+
+
+def add_slots(cls: T) -> T:
+    """Recreate a dataclass with ``__slots__`` for the fields it declares.
+
+    Slots already declared in the class body are kept, for private state that
+    is not a dataclass field. Every base class must define ``__slots__`` as
+    well, otherwise instances still get a ``__dict__``. Methods of the decorated class must not use
+    zero-argument ``super()``, whose implicit class cell keeps pointing at the
+    original class.
+
+    Args:
+        cls (type): Class already processed by :func:`dataclasses.dataclass`.
+
+    Returns:
+        type: The equivalent class with ``__slots__``.
+    """
+
+    inherited = {f.name for base in cls.__mro__[1:] for f in getattr(base, "__dataclass_fields__", {}).values()}
+    own = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    own += tuple(name for name in cls.__dict__.get("__slots__", ()) if name not in own)
+
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = own
+    for name in own:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        namespace["__getstate__"] = _getstate
+        namespace["__setstate__"] = _setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)  # type: ignore[return-value]
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, Mapping, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Mapping, TypeVar
 
 from typing_extensions import Protocol
 
+from unirules.core._slots import add_slots
+
 R_co = TypeVar("R_co", covariant=True)
 
 if TYPE_CHECKING:
@@ -18,7 +20,34 @@ if TYPE_CHECKING:
 
 Context = Mapping[str, object]
 
-__all__ = ["Context", "CondVisitor", "Cond", "And", "Or", "Not", "AlwaysTrue", "R_co"]
+__all__ = [
+    "Context",
+    "CondVisitor",
+    "Cond",
+    "And",
+    "Or",
+    "Not",
+    "AlwaysTrue",
+    "R_co",
+    "VISIT_METHODS",
+    "dispatch_table",
+]
+
+# Visitor method names indexed by ``Cond.KIND``.
+VISIT_METHODS: tuple[str, ...] = (
+    "visit_between",
+    "visit_gt",
+    "visit_ge",
+    "visit_lt",
+    "visit_le",
+    "visit_eq",
+    "visit_in",
+    "visit_notin",
+    "visit_and",
+    "visit_or",
+    "visit_not",
+    "visit_always_true",
+)
 
 
 class CondVisitor(Protocol[R_co]):
@@ -47,9 +76,29 @@ class CondVisitor(Protocol[R_co]):
     def visit_le(self, cond: "Le") -> R_co: ...
 
 
+def dispatch_table(visitor_cls: type) -> tuple[Callable[[Any, Any], Any], ...]:
+    """Build a table of visitor functions indexed by ``Cond.KIND``.
+
+    Hot traversal loops call ``table[cond.KIND](visitor, cond)`` instead of
+    ``cond.accept(visitor)``, replacing two bound-method dispatches with one
+    tuple lookup and a direct call.
+
+    Args:
+        visitor_cls (type): Visitor class implementing every ``visit_*`` method.
+
+    Returns:
+        tuple[Callable[[Any, Any], Any], ...]: Unbound visitor functions.
+    """
+    return tuple(getattr(visitor_cls, name) for name in VISIT_METHODS)
+
+
 class Cond(ABC):
     """Base class for conditions in the rule evaluation system."""
 
+    __slots__ = ()
+
+    KIND: ClassVar[int]
+
     @abstractmethod
     def eval(self, ctx: Context) -> bool:
         """Evaluate the condition against a context dictionary.
@@ -92,10 +141,13 @@ class Cond(ABC):
         return Not(self)
 
 
+@add_slots
 @dataclass(frozen=True)
 class And(Cond):
     """Condition combining two conditions with logical AND."""
 
+    KIND: ClassVar[int] = 8
+
     a: Cond
     b: Cond
 
@@ -115,14 +167,16 @@ class And(Cond):
         return visitor.visit_and(self)
 
     def iter_field_refs(self) -> Iterable["FieldRef[Domain]"]:
-        yield from self.a.iter_field_refs()
-        yield from self.b.iter_field_refs()
+        return (*self.a.iter_field_refs(), *self.b.iter_field_refs())
 
 
+@add_slots
 @dataclass(frozen=True)
 class Or(Cond):
     """Condition combining two conditions with logical OR."""
 
+    KIND: ClassVar[int] = 9
+
     a: Cond
     b: Cond
 
@@ -142,14 +196,16 @@ class Or(Cond):
         return visitor.visit_or(self)
 
     def iter_field_refs(self) -> Iterable["FieldRef[Domain]"]:
-        yield from self.a.iter_field_refs()
-        yield from self.b.iter_field_refs()
+        return (*self.a.iter_field_refs(), *self.b.iter_field_refs())
 
 
+@add_slots
 @dataclass(frozen=True)
 class Not(Cond):
     """Condition negating another condition."""
 
+    KIND: ClassVar[int] = 10
+
     a: Cond
 
     def eval(self, ctx: Context) -> bool:
@@ -168,13 +224,16 @@ class Not(Cond):
         return visitor.visit_not(self)
 
     def iter_field_refs(self) -> Iterable["FieldRef[Domain]"]:
-        yield from self.a.iter_field_refs()
+        return self.a.iter_field_refs()
 
 
+@add_slots
 @dataclass(frozen=True)
 class AlwaysTrue(Cond):
     """A condition that always evaluates to True."""
 
+    KIND: ClassVar[int] = 11
+
     def eval(self, ctx: Context) -> bool:
         """Always return ``True``.
 
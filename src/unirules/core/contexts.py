@@ -0,0 +1,66 @@
+"""
+Columnar context layouts.
+
+A :data:`~unirules.core.conditions.Context` describes a single row as a
+mapping of field names to values. :class:`ContextBatch` stores many rows as
+one NumPy array per field (struct of arrays), so conditions can be evaluated
+over every row with a single array operation. This module requires NumPy and
+is only imported by the batch evaluation paths.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ["ContextBatch"]
+
+
+class ContextBatch(Mapping[str, NDArray[Any]]):
+    """Equally sized columns of field values, one array per field.
+
+    Interval columns are ``float64`` arrays with missing values encoded as
+    ``NaN``; discrete columns hold the integer codes assigned by
+    :meth:`DiscreteDomain.encode`, with missing values encoded as ``-1``.
+    Fields absent from the batch are missing in every row.
+
+    Attributes:
+        size (int): Number of rows in the batch.
+    """
+
+    __slots__ = ("_columns", "size")
+
+    def __init__(self, columns: Mapping[str, NDArray[Any]], size: int = 0) -> None:
+        """Create a batch from already converted columns.
+
+        Args:
+            columns (Mapping[str, NDArray[Any]]): One-dimensional arrays keyed
+                by field name.
+            size (int): Number of rows, used when ``columns`` is empty.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+
+        sizes = {len(col) for col in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Batch columns differ in length: {sorted(sizes)}")
+        self._columns = dict(columns)
+        self.size = sizes.pop() if sizes else size
+
+    def __getitem__(self, name: str) -> NDArray[Any]:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def full(self, value: bool) -> NDArray[np.bool_]:
+        """Return a mask with every row set to ``value``."""
+
+        return np.full(self.size, value, dtype=np.bool_)
@@ -8,6 +8,8 @@ from unirules.core.domains import Domain
 
 DomainT_co = TypeVar("DomainT_co", bound=Domain, covariant=True)
 
+_MISSING = object()
+
 
 class FieldRef(ABC, Generic[DomainT_co]):
     """Reference to a field in the context.
@@ -15,6 +17,11 @@ class FieldRef(ABC, Generic[DomainT_co]):
     Subclasses specialize the domain type for discrete and interval cases.
     """
 
+    __slots__ = ()
+
+    # Whether ``normalize_value`` may return a different object than it got.
+    NORMALIZES: ClassVar[bool] = False
+
     name: str
     domain: DomainT_co
 
@@ -31,9 +38,10 @@ class FieldRef(ABC, Generic[DomainT_co]):
     def validate_context(self, ctx: Mapping[str, object]) -> None:
         """Validate a context value for this field if present."""
 
-        if self.name not in ctx:
+        value = ctx.get(self.name, _MISSING)
+        if value is _MISSING:
             return
-        self.normalize_value(ctx[self.name], role="Context value")
+        self.normalize_value(value, role="Context value")
 
 
 class Field(ABC, Generic[DomainT_co]):
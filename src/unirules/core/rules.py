@@ -7,14 +7,15 @@ and builder patterns for creating rules with fluent syntax.
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Generic, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, Union, cast
 
 from typing_extensions import TypeAlias
 
-from unirules.core.conditions import Cond
+from unirules.core._slots import add_slots
+from unirules.core.conditions import Cond, Context
 from unirules.core.domains import Domain
 from unirules.core.fields import FieldRef
 
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
     from unirules.engines.resolver import Resolver
 
 V = TypeVar("V")
+T = TypeVar("T")
 
 __all__ = ["RuleValue", "RuleTree", "RuleItem", "RuleSet", "RuleSetPolicy", "V"]
 
@@ -34,6 +36,7 @@ class RuleSetPolicy(str, Enum):
     PRIORITY = "priority"
 
 
+@add_slots
 @dataclass(frozen=True)
 class RuleValue(Generic[V]):
     """A rule that assigns a value when its condition is met."""
@@ -44,6 +47,7 @@ class RuleValue(Generic[V]):
     priority: int = 0
 
 
+@add_slots
 @dataclass(frozen=True)
 class RuleTree(Generic[V]):
     """A rule that branches to a subtree when its condition is met."""
@@ -58,7 +62,22 @@ RuleItem: TypeAlias = Union[RuleValue[V], RuleTree[V]]
 
 
 class RuleSet(Generic[V]):
-    """A collection of rules evaluated in order."""
+    """A collection of rules evaluated in order.
+
+    Rule sets are immutable: evaluation order, field references and compiled
+    resolvers are derived once from the rules and cached on the instance.
+    """
+
+    __slots__ = (
+        "rules",
+        "policy",
+        "_ordered",
+        "_field_refs_by_name",
+        "_field_refs",
+        "_field_names",
+        "_needs_normalization",
+        "_traversal_cache",
+    )
 
     def __init__(
         self,
@@ -70,16 +89,17 @@ class RuleSet(Generic[V]):
 
         Args:
             rules (Sequence[RuleItem[V]]): Ordered sequence of rule items to
-                evaluate.
+                evaluate, stored as a tuple.
             policy (str | RuleSetPolicy): Evaluation policy controlling how
-                rules are traversed during resolution and analysis.
+                rules are traversed during resolution and analysis. Strings
+                are matched case-insensitively.
         """
-        self.rules: list[RuleItem[V]] = list(rules)
+        self.rules: tuple[RuleItem[V], ...] = tuple(rules)
         if isinstance(policy, RuleSetPolicy):
             self.policy = policy
         elif isinstance(policy, str):
             try:
-                self.policy = RuleSetPolicy(policy)
+                self.policy = RuleSetPolicy(policy.lower())
             except ValueError as exc:
                 raise ValueError(f"Unsupported ruleset policy: {policy!r}") from exc
         else:
@@ -87,23 +107,107 @@ class RuleSet(Generic[V]):
                 f"Policy must be specified as a string or RuleSetPolicy, got {type(policy).__name__}",
             )
 
+        # Evaluation order, sorted once here so engines never sort per call.
+        # ``sorted`` is stable, keeping declaration order on equal priority.
+        ordered = list(enumerate(self.rules))
+        if self.policy is RuleSetPolicy.PRIORITY:
+            ordered.sort(key=lambda pair: -pair[1].priority)
+        self._ordered: tuple[tuple[int, RuleItem[V]], ...] = tuple(ordered)
+
+        # Subtrees were built first, so their field tuples are merged as is
+        # instead of walking their rules again.
         field_refs_by_name: dict[str, FieldRef[Domain]] = {}
         for item in self.rules:
             for field in item.condition.iter_field_refs():
-                if field.name not in field_refs_by_name:
-                    field_refs_by_name[field.name] = field
+                field_refs_by_name.setdefault(field.name, field)
             if isinstance(item, RuleTree):
-                for field in item.subtree.iter_field_refs():
-                    if field.name not in field_refs_by_name:
-                        field_refs_by_name[field.name] = field
+                for field in item.subtree._field_refs:
+                    field_refs_by_name.setdefault(field.name, field)
 
         self._field_refs_by_name = field_refs_by_name
         self._field_refs: tuple[FieldRef[Domain], ...] = tuple(field_refs_by_name.values())
+        # Field names in index order; positional value lists follow it.
+        self._field_names: tuple[str, ...] = tuple(field_refs_by_name)
+        self._needs_normalization = any(field.NORMALIZES for field in self._field_refs)
+        # Results of whole-tree passes (compiled resolvers, validation plans,
+        # analysis domains, ...) keyed by pass name, computed at most once.
+        self._traversal_cache: dict[str, Any] = {}
+
+    def __getstate__(self) -> tuple[tuple[RuleItem[V], ...], RuleSetPolicy]:
+        # Cached passes may hold generated functions, which cannot be
+        # pickled; everything else is derived from the rules again on load.
+        return self.rules, self.policy
+
+    def __setstate__(self, state: tuple[tuple[RuleItem[V], ...], RuleSetPolicy]) -> None:
+        rules, policy = state
+        RuleSet.__init__(self, rules, policy=policy)
+
+    def _cached(self, key: str, build: Callable[[RuleSet[Any]], T]) -> T:
+        """Return the result of a traversal pass, running it on first use.
+
+        Args:
+            key (str): Name of the pass.
+            build (Callable[[RuleSet[Any]], T]): Function performing the pass.
+
+        Returns:
+            T: The cached result for this ruleset.
+        """
+
+        try:
+            return cast(T, self._traversal_cache[key])
+        except KeyError:
+            result = self._traversal_cache[key] = build(self)
+            return result
+
+    def compile(self) -> Callable[[Context], V]:
+        """Compile the ruleset into a single resolve function.
+
+        Conditions are inlined into generated Python code, so resolving a
+        context costs no per-condition method calls. The function is built on
+        first use and cached on the ruleset.
+
+        Returns:
+            Callable[[Context], V]: Function resolving an already validated
+            context, raising :class:`LookupError` when no rule matches.
+        """
+
+        from unirules.engines._codegen import compile_context_resolver  # noqa: PLC0415
+
+        return self._cached("compile", compile_context_resolver)
+
+    def evaluate_batch(self, data: Mapping[str, Iterable[Any]], *, backend: str = "numpy") -> list[V]:
+        """Resolve a batch of rows stored column-wise.
+
+        Each condition is evaluated as a NumPy mask over all rows at once,
+        which is much faster than resolving the rows one by one. Requires the
+        optional ``numpy`` dependency.
+
+        Args:
+            data (Mapping[str, Iterable[Any]]): Mapping (or data frame) of
+                field names to equally sized columns. Missing interval values
+                are encoded as ``NaN`` and missing discrete values as ``None``.
+            backend (str): ``"numpy"`` (default) evaluates conditions as array
+                masks. ``"numba"`` jit-compiles a row loop on first use and
+                requires the optional ``numba`` dependency; it only supports
+                rulesets whose conditions all test interval fields.
+
+        Returns:
+            list[V]: The resolved value for each row, in row order.
+
+        Raises:
+            ValueError: If a column contains values outside of its domain or
+                the backend cannot evaluate this ruleset.
+            LookupError: If no rule matches some row.
+        """
+
+        from unirules.engines._batch import evaluate_batch  # noqa: PLC0415
+
+        return evaluate_batch(self, data, backend=backend)
 
-    def to_resolver(self) -> "Resolver[V]":
+    def to_resolver(self, *, cache_size: int = 0) -> "Resolver[V]":
         from unirules.engines.resolver import Resolver  # noqa: PLC0415
 
-        return Resolver(ruleset=self)
+        return Resolver(ruleset=self, cache_size=cache_size)
 
     def to_analyzer(self) -> "Analyzer[V]":
         from unirules.engines.analyzer import Analyzer  # noqa: PLC0415
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
+from unirules.core._slots import add_slots
 from unirules.core.conditions import Cond, CondVisitor, Context, R_co
 from unirules.core.domains import Domain
 from unirules.core.fields import FieldRef
 
 
+@add_slots
 @dataclass(frozen=True)
 class Eq(Cond):
     """Condition checking if a field equals a specific value."""
 
+    KIND: ClassVar[int] = 5
+
     field: FieldRef[Domain]
     value: Any
 
@@ -34,7 +38,7 @@ class Eq(Cond):
         return visitor.visit_eq(self)
 
     def iter_field_refs(self):
-        yield self.field
+        return (self.field,)
 
 
 __all__ = ["Eq"]
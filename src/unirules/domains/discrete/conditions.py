@@ -2,24 +2,29 @@ from __future__ import annotations
 
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
+from unirules.core._slots import add_slots
 from unirules.core.conditions import Cond, CondVisitor, Context, R_co
 from unirules.domains.discrete.field_ref import DiscreteFieldRef
 
 
+@add_slots
 @dataclass(frozen=True)
 class DiscreteCond(Cond, ABC):
     field: DiscreteFieldRef
 
     def iter_field_refs(self):
-        yield self.field
+        return (self.field,)
 
 
+@add_slots
 @dataclass(frozen=True)
 class In_(DiscreteCond):
     """Condition checking if a field value is in a set of items."""
 
+    KIND: ClassVar[int] = 6
+
     items: frozenset[Any]
 
     def __post_init__(self) -> None:
@@ -42,10 +47,13 @@ class In_(DiscreteCond):
         return visitor.visit_in(self)
 
 
+@add_slots
 @dataclass(frozen=True)
 class NotIn_(DiscreteCond):
     """Condition checking if a field value is not in a set of items."""
 
+    KIND: ClassVar[int] = 7
+
     items: frozenset[Any]
 
     def __post_init__(self) -> None:
@@ -18,6 +18,43 @@ class DiscreteDomain(Domain):
                 domain or an enumeration whose members define the domain.
         """
         self.vals = frozenset(vals)
+        try:
+            members = tuple(sorted(self.vals))
+        except TypeError:  # mixed types without an order
+            members = tuple(self.vals)
+        self.members: tuple[Any, ...] = members
+        self.codes: dict[Any, int] = {value: code for code, value in enumerate(members)}
+
+    def encode(self, value: Any) -> int:
+        """Return the small integer code of a domain value.
+
+        Codes index :attr:`members` and are assigned once, when the domain is
+        created, so columns of values can be stored and compared as integers.
+
+        Args:
+            value (Any): Member of the domain.
+
+        Returns:
+            int: The code of ``value``.
+
+        Raises:
+            ValueError: If ``value`` is not a member of the domain.
+        """
+        try:
+            return self.codes[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Value {value!r} is not a member of the domain") from None
+
+    def decode(self, code: int) -> Any:
+        """Return the domain value encoded as ``code``.
+
+        Args:
+            code (int): Code returned by :meth:`encode`.
+
+        Returns:
+            Any: The corresponding member of the domain.
+        """
+        return self.members[code]
 
     def get_universe(self) -> DiscreteSet:
         """Return the universe of this domain.
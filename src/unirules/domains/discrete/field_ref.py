@@ -1,26 +1,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from typing import Any
 
+from unirules.core._slots import add_slots
 from unirules.core.fields import FieldRef
 from unirules.domains.discrete.domain import DiscreteDomain
 
 
+@add_slots
 @dataclass(frozen=True)
 class DiscreteFieldRef(FieldRef[DiscreteDomain]):
     name: str
     domain: DiscreteDomain
+    _vals: frozenset[Any] = dataclass_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_vals", frozenset(self.domain.vals))
 
     def validate_value(self, value: object, *, role: str) -> None:
         try:
-            if value not in self.domain.vals:
-                raise ValueError(
-                    f"{role} {value!r} for field '{self.name}' is not allowed",
-                )
-        except TypeError as exc:
+            allowed = value in self._vals
+        except TypeError:  # unhashable values can never be domain members
+            allowed = False
+        if not allowed:
             raise ValueError(
                 f"{role} {value!r} for field '{self.name}' is not allowed",
-            ) from exc
+            )
 
 
 __all__ = ["DiscreteFieldRef"]
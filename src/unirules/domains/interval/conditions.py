@@ -1,33 +1,103 @@
 from __future__ import annotations
 
-from abc import ABC
+import sys
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import cast
+from typing import TYPE_CHECKING, Callable, ClassVar
 
+from unirules.core._slots import add_slots
 from unirules.core.conditions import Cond, CondVisitor, Context, R_co
 from unirules.domains.interval.field_ref import IntervalFieldRef
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
+    from unirules.core.contexts import ContextBatch
+
+_MISSING = object()
+
+
+def _between_check(lo: float, hi: float, left_closed: bool, right_closed: bool) -> Callable[[float], bool]:
+    """Return a predicate specialised for the given bounds and closedness."""
+
+    if left_closed and right_closed:
+        return lambda v: lo < v < hi
+    if left_closed:
+        return lambda v: lo < v <= hi
+    if right_closed:
+        return lambda v: lo <= v < hi
+    return lambda v: lo <= v <= hi
+
+
+@add_slots
 @dataclass(frozen=True)
 class IntervalCond(Cond, ABC):
     field: IntervalFieldRef
+    _name: str = dataclass_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_name", sys.intern(self.field.name))
+
+    @abstractmethod
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        """Evaluate the condition over a column of field values.
+
+        Args:
+            arr (NDArray[np.float64]): Field values, with missing entries
+                encoded as ``NaN``.
+
+        Returns:
+            NDArray[np.bool_]: Mask of rows satisfying the condition. ``NaN``
+            entries never match.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def bounds(self) -> tuple[float, ...]:
+        """Return the points at which the condition may change its outcome.
+
+        Between and around these points the outcome is constant, which lets
+        resolvers precompute the first matching rule per region.
+        """
+        raise NotImplementedError
+
+    def eval_batch(self, batch: ContextBatch) -> NDArray[np.bool_]:
+        """Evaluate the condition for every row of a columnar batch.
+
+        Args:
+            batch (ContextBatch): Columns of field values.
+
+        Returns:
+            NDArray[np.bool_]: Mask of rows satisfying the condition. Rows
+            where the field is missing never match.
+        """
+        col = batch.get(self._name)
+        if col is None:
+            return batch.full(False)
+        return self.eval_column(col)
 
     def iter_field_refs(self):
-        yield self.field
+        return (self.field,)
 
 
+@add_slots
 @dataclass(frozen=True)
 class Between(IntervalCond):
     """Condition checking if a field value lies within a specified range."""
 
+    KIND: ClassVar[int] = 0
+
     lo: float
     hi: float
     closed: str = "both"  # "both" | "left" | "right" | "none"
     left_closed: bool = dataclass_field(init=False, repr=False, compare=False)
     right_closed: bool = dataclass_field(init=False, repr=False, compare=False)
+    _check: Callable[[float], bool] = dataclass_field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        IntervalCond.__post_init__(self)
         if self.closed not in {"both", "left", "right", "none"}:
             raise ValueError(
                 f"Invalid closed value {self.closed!r} for field '{self.field.name}'",
@@ -42,8 +112,11 @@ class Between(IntervalCond):
             )
         object.__setattr__(self, "lo", lo)
         object.__setattr__(self, "hi", hi)
-        object.__setattr__(self, "left_closed", self.closed in ("left", "both"))
-        object.__setattr__(self, "right_closed", self.closed in ("right", "both"))
+        left_closed = self.closed in ("left", "both")
+        right_closed = self.closed in ("right", "both")
+        object.__setattr__(self, "left_closed", left_closed)
+        object.__setattr__(self, "right_closed", right_closed)
+        object.__setattr__(self, "_check", _between_check(lo, hi, left_closed, right_closed))
 
     def eval(self, ctx: Context) -> bool:
         """Evaluate whether the field value is within the specified range.
@@ -55,26 +128,34 @@ class Between(IntervalCond):
             bool: ``True`` if the value falls within the configured range;
             ``False`` otherwise.
         """
-        if self.field.name not in ctx:
+        v = ctx.get(self._name, _MISSING)
+        if v is _MISSING:
             return False
-        v = cast(float, ctx[self.field.name])
-        lo = self.lo
-        hi = self.hi
-        left_ok = v > lo if self.left_closed else v >= lo
-        right_ok = v < hi if self.right_closed else v <= hi
-        return left_ok and right_ok
+        return self._check(v)  # type: ignore[arg-type]
 
     def accept(self, visitor: CondVisitor[R_co]) -> R_co:
         return visitor.visit_between(self)
 
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        left_ok = arr > self.lo if self.left_closed else arr >= self.lo
+        right_ok = arr < self.hi if self.right_closed else arr <= self.hi
+        return left_ok & right_ok
 
+    def bounds(self) -> tuple[float, ...]:
+        return (self.lo, self.hi)
+
+
+@add_slots
 @dataclass(frozen=True)
 class Gt(IntervalCond):
     """Condition checking if a field value is greater than a specific value."""
 
+    KIND: ClassVar[int] = 1
+
     value: float
 
     def __post_init__(self) -> None:
+        IntervalCond.__post_init__(self)
         value = self.field.coerce(self.value, role="Condition value")
         object.__setattr__(self, "value", value)
 
@@ -88,22 +169,32 @@ class Gt(IntervalCond):
             bool: ``True`` if the field value is greater than ``value``;
             ``False`` otherwise.
         """
-        if self.field.name not in ctx:
+        v = ctx.get(self._name, _MISSING)
+        if v is _MISSING:
             return False
-        v = cast(float, ctx[self.field.name])
-        return v > self.value
+        return v > self.value  # type: ignore[operator]
 
     def accept(self, visitor: CondVisitor[R_co]) -> R_co:
         return visitor.visit_gt(self)
 
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        return arr > self.value
+
+    def bounds(self) -> tuple[float, ...]:
+        return (self.value,)
+
 
+@add_slots
 @dataclass(frozen=True)
 class Ge(IntervalCond):
     """Condition checking if a field value is greater than or equal to a specific value."""
 
+    KIND: ClassVar[int] = 2
+
     value: float
 
     def __post_init__(self) -> None:
+        IntervalCond.__post_init__(self)
         value = self.field.coerce(self.value, role="Condition value")
         object.__setattr__(self, "value", value)
 
@@ -117,22 +208,32 @@ class Ge(IntervalCond):
             bool: ``True`` if the field value is greater than or equal to
             ``value``; ``False`` otherwise.
         """
-        if self.field.name not in ctx:
+        v = ctx.get(self._name, _MISSING)
+        if v is _MISSING:
             return False
-        v = cast(float, ctx[self.field.name])
-        return v >= self.value
+        return v >= self.value  # type: ignore[operator]
 
     def accept(self, visitor: CondVisitor[R_co]) -> R_co:
         return visitor.visit_ge(self)
 
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        return arr >= self.value
+
+    def bounds(self) -> tuple[float, ...]:
+        return (self.value,)
+
 
+@add_slots
 @dataclass(frozen=True)
 class Lt(IntervalCond):
     """Condition checking if a field value is less than a specific value."""
 
+    KIND: ClassVar[int] = 3
+
     value: float
 
     def __post_init__(self) -> None:
+        IntervalCond.__post_init__(self)
         value = self.field.coerce(self.value, role="Condition value")
         object.__setattr__(self, "value", value)
 
@@ -146,22 +247,32 @@ class Lt(IntervalCond):
             bool: ``True`` if the field value is less than ``value``;
             ``False`` otherwise.
         """
-        if self.field.name not in ctx:
+        v = ctx.get(self._name, _MISSING)
+        if v is _MISSING:
             return False
-        v = cast(float, ctx[self.field.name])
-        return v < self.value
+        return v < self.value  # type: ignore[operator]
 
     def accept(self, visitor: CondVisitor[R_co]) -> R_co:
         return visitor.visit_lt(self)
 
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        return arr < self.value
+
+    def bounds(self) -> tuple[float, ...]:
+        return (self.value,)
 
+
+@add_slots
 @dataclass(frozen=True)
 class Le(IntervalCond):
     """Condition checking if a field value is less than or equal to a specific value."""
 
+    KIND: ClassVar[int] = 4
+
     value: float
 
     def __post_init__(self) -> None:
+        IntervalCond.__post_init__(self)
         value = self.field.coerce(self.value, role="Condition value")
         object.__setattr__(self, "value", value)
 
@@ -175,13 +286,19 @@ class Le(IntervalCond):
             bool: ``True`` if the field value is less than or equal to
             ``value``; ``False`` otherwise.
         """
-        if self.field.name not in ctx:
+        v = ctx.get(self._name, _MISSING)
+        if v is _MISSING:
             return False
-        v = cast(float, ctx[self.field.name])
-        return v <= self.value
+        return v <= self.value  # type: ignore[operator]
 
     def accept(self, visitor: CondVisitor[R_co]) -> R_co:
         return visitor.visit_le(self)
 
+    def eval_column(self, arr: NDArray[np.float64]) -> NDArray[np.bool_]:
+        return arr <= self.value
+
+    def bounds(self) -> tuple[float, ...]:
+        return (self.value,)
+
 
 __all__ = ["IntervalCond", "Between", "Gt", "Ge", "Lt", "Le"]
@@ -1,26 +1,35 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
+from unirules.core._slots import add_slots
 from unirules.core.fields import FieldRef
 from unirules.domains.interval.domain import IntervalDomain
 
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
 
+
+@add_slots
 @dataclass(frozen=True)
 class IntervalFieldRef(FieldRef[IntervalDomain]):
+    NORMALIZES: ClassVar[bool] = True
+
     name: str
     domain: IntervalDomain
 
     def coerce(self, raw: object, *, role: str) -> float:
-        try:
-            numeric = float(cast(Any, raw))
-        except (TypeError, ValueError) as exc:
-            raise ValueError(
-                f"{role} {raw!r} for field '{self.name}' is not numeric",
-            ) from exc
-        if not math.isfinite(numeric):
+        if type(raw) is float:
+            numeric = raw
+        else:
+            try:
+                numeric = float(cast(Any, raw))
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"{role} {raw!r} for field '{self.name}' is not numeric",
+                ) from exc
+        if not _NEG_INF < numeric < _POS_INF:  # also rejects NaN
             raise ValueError(
                 f"{role} {raw!r} for field '{self.name}' is not numeric",
             )
@@ -116,6 +116,9 @@ class _Builder(Generic[V]):
     def then(self, result: Union[V, RuleSet[V]]) -> RuleItem[V]:
         """Create a rule with the specified result.
 
+        The value is stored as is: resolvers return this very object for every
+        matching context instead of a copy, so it should not be mutated.
+
         Args:
             result (Union[V, RuleSet[V]]): The value or nested ruleset emitted
                 when the condition matches.
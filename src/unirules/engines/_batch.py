@@ -0,0 +1,291 @@
+"""
+Vectorised evaluation of rulesets over columns of values.
+
+Instead of resolving one context at a time, the rows of a batch are stored as
+a :class:`ContextBatch` (one NumPy array per field) and every condition is
+evaluated as a boolean mask over all rows at once.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence, Sized
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Context, Not, Or, dispatch_table
+from unirules.core.contexts import ContextBatch
+from unirules.core.fields import FieldRef
+from unirules.core.rules import RuleSet, RuleTree, RuleValue, V
+from unirules.domains.common.conditions import Eq
+from unirules.domains.discrete.conditions import In_, NotIn_
+from unirules.domains.discrete.field_ref import DiscreteFieldRef
+from unirules.domains.interval.conditions import Between, Ge, Gt, IntervalCond, Le, Lt
+from unirules.domains.interval.field_ref import IntervalFieldRef
+from unirules.engines._ctx_validation import MISSING
+from unirules.engines._optimize import fold_rules
+
+__all__ = ["evaluate_batch", "evaluate_contexts"]
+
+Mask = NDArray[np.bool_]
+
+# Code of missing values in discrete columns; domain codes are non-negative.
+_NO_CODE = -1
+
+
+def _scalar(value: Any) -> Any:
+    """Unwrap NumPy scalars so errors show values like the scalar resolver does."""
+
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _interval_column(ref: IntervalFieldRef, raw: Iterable[Any]) -> NDArray[np.float64]:
+    """Convert and validate a column of interval values."""
+
+    try:
+        col = np.asarray(raw, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Context values for field '{ref.name}' are not numeric") from exc
+    if col.ndim != 1:
+        raise ValueError(f"Context values for field '{ref.name}' must be one-dimensional")
+    invalid = np.isinf(col) | (col < ref.domain.lo) | (col > ref.domain.hi)
+    if invalid.any():
+        bad = _scalar(np.asarray(raw)[int(np.flatnonzero(invalid)[0])])
+        ref.validate_value(bad, role="Context value")
+        raise ValueError(f"Context value {bad!r} for field '{ref.name}' is outside of allowed range")
+    return col
+
+
+def _discrete_column(ref: DiscreteFieldRef, raw: Iterable[Any]) -> NDArray[np.integer[Any]]:
+    """Encode and validate a column of discrete values as domain codes."""
+
+    values = list(raw)
+    codes = ref.domain.codes
+    try:
+        encoded = [_NO_CODE if value is None else codes[value] for value in values]
+    except (KeyError, TypeError):
+        for value in values:
+            if value is not None:
+                ref.validate_value(_scalar(value), role="Context value")
+        raise
+    dtype = np.int8 if len(codes) <= np.iinfo(np.int8).max else np.int32
+    return np.array(encoded, dtype=dtype)
+
+
+def _codes(ref: DiscreteFieldRef, items: Iterable[Any]) -> list[int]:
+    return [ref.domain.encode(item) for item in items]
+
+
+class _BatchEvaluator(CondVisitor[Mask]):
+    """Evaluate conditions as boolean masks over columnar data."""
+
+    def __init__(self, batch: ContextBatch) -> None:
+        self.batch = batch
+        self.payloads: list[object] = []
+        self.result: NDArray[np.intp] = np.full(batch.size, -1, dtype=np.intp)
+
+    def mask(self, cond: Cond) -> Mask:
+        return _MASK[cond.KIND](self, cond)
+
+    def _interval(self, cond: IntervalCond) -> Mask:
+        return cond.eval_batch(self.batch)
+
+    def visit_eq(self, cond: Eq) -> Mask:
+        col = self.batch.get(cond.field.name)
+        if col is None:
+            return self.batch.full(False)
+        if isinstance(cond.field, IntervalFieldRef):
+            return col == float(cond.value)
+        assert isinstance(cond.field, DiscreteFieldRef)
+        return col == cond.field.domain.encode(cond.value)
+
+    def visit_in(self, cond: In_) -> Mask:
+        col = self.batch.get(cond.field.name)
+        if col is None:
+            return self.batch.full(False)
+        return np.isin(col, _codes(cond.field, cond.items))
+
+    def visit_notin(self, cond: NotIn_) -> Mask:
+        col = self.batch.get(cond.field.name)
+        if col is None:
+            return self.batch.full(True)
+        return ~np.isin(col, _codes(cond.field, cond.items))
+
+    def visit_between(self, cond: Between) -> Mask:
+        return self._interval(cond)
+
+    def visit_gt(self, cond: Gt) -> Mask:
+        return self._interval(cond)
+
+    def visit_ge(self, cond: Ge) -> Mask:
+        return self._interval(cond)
+
+    def visit_lt(self, cond: Lt) -> Mask:
+        return self._interval(cond)
+
+    def visit_le(self, cond: Le) -> Mask:
+        return self._interval(cond)
+
+    def visit_and(self, cond: And) -> Mask:
+        return self.mask(cond.a) & self.mask(cond.b)
+
+    def visit_or(self, cond: Or) -> Mask:
+        return self.mask(cond.a) | self.mask(cond.b)
+
+    def visit_not(self, cond: Not) -> Mask:
+        return ~self.mask(cond.a)
+
+    def visit_always_true(self, cond: AlwaysTrue) -> Mask:  # noqa: ARG002 - signature required
+        return self.batch.full(True)
+
+    def resolve(self, ruleset: RuleSet[V], active: Mask) -> Mask:
+        """Assign payload indices for ``active`` rows and return unmatched rows.
+
+        Args:
+            ruleset: Rule set to evaluate.
+            active: Rows routed to this rule set.
+
+        Returns:
+            Mask of rows that no rule of the rule set matched.
+        """
+
+        for rule in fold_rules(ruleset):
+            if not active.any():
+                break
+            matched = self.mask(rule.condition) & active
+            if isinstance(rule, RuleValue):
+                self.result = np.where(matched, len(self.payloads), self.result)
+                self.payloads.append(rule.value)
+            else:
+                assert isinstance(rule, RuleTree)
+                unmatched = self.resolve(rule.subtree, matched)
+                if unmatched.any():
+                    raise LookupError(f"No rule matched for row {int(np.flatnonzero(unmatched)[0])}")
+            active = active & ~matched
+        return active
+
+
+_MASK = dispatch_table(_BatchEvaluator)
+
+
+def _evaluate_numba(ruleset: RuleSet[V], batch: ContextBatch) -> list[V]:
+    from unirules.engines._numba_backend import compile_kernel  # noqa: PLC0415
+
+    kernel = ruleset._cached("numba", compile_kernel)
+    missing = np.full(batch.size, np.nan)
+    out = np.empty(batch.size, dtype=np.int32)
+    kernel.func(*(batch.get(name, missing) for name in kernel.fields), out)
+    unmatched = np.flatnonzero(out < 0)
+    if unmatched.size:
+        raise LookupError(f"No rule matched for row {int(unmatched[0])}")
+    payloads = kernel.payloads
+    return [payloads[i] for i in out.tolist()]
+
+
+def _evaluate(ruleset: RuleSet[V], batch: ContextBatch, backend: str) -> list[V]:
+    if backend == "numba":
+        return _evaluate_numba(ruleset, batch)
+
+    evaluator = _BatchEvaluator(batch)
+    unmatched = evaluator.resolve(ruleset, batch.full(True))
+    if unmatched.any():
+        raise LookupError(f"No rule matched for row {int(np.flatnonzero(unmatched)[0])}")
+    payloads = evaluator.payloads
+    return [payloads[i] for i in evaluator.result.tolist()]
+
+
+def _row_count(columns: Iterable[Iterable[Any]]) -> int:
+    sizes = {len(col if isinstance(col, Sized) else list(col)) for col in columns}
+    if len(sizes) > 1:
+        raise ValueError(f"Batch columns differ in length: {sorted(sizes)}")
+    return sizes.pop() if sizes else 0
+
+
+def evaluate_batch(ruleset: RuleSet[V], data: Mapping[str, Iterable[Any]], *, backend: str = "numpy") -> list[V]:
+    """Resolve every row of a columnar batch against a rule set.
+
+    Args:
+        ruleset: Rule set definition to evaluate.
+        data: Mapping (data frame or :class:`ContextBatch`) of field names to
+            equally sized columns. Fields absent from ``data`` are treated as
+            missing in every row. A :class:`ContextBatch` is used as is, so
+            its columns must already be converted (discrete columns hold
+            domain codes) and are not validated again.
+        backend: ``"numpy"`` evaluates conditions as array masks; ``"numba"``
+            runs a jit-compiled row loop and only supports interval-only rule
+            sets.
+
+    Returns:
+        The resolved value for each row, in row order.
+
+    Raises:
+        ValueError: If a column contains values outside of its field domain,
+            columns differ in length, or the backend is not supported.
+        LookupError: If no rule matches some row.
+    """
+
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Unsupported batch backend: {backend!r}")
+    if isinstance(data, ContextBatch):
+        return _evaluate(ruleset, data, backend)
+
+    columns: dict[str, NDArray[Any]] = {}
+    for ref in ruleset.iter_field_refs():
+        if ref.name not in data:
+            continue
+        raw = data[ref.name]
+        if isinstance(ref, IntervalFieldRef):
+            columns[ref.name] = _interval_column(ref, raw)
+        else:
+            assert isinstance(ref, DiscreteFieldRef)
+            columns[ref.name] = _discrete_column(ref, raw)
+
+    # Columns of fields the rule set does not read still fix the row count.
+    size = 0 if columns else _row_count(data.values())
+    return _evaluate(ruleset, ContextBatch(columns, size=size), backend)
+
+
+def _row_values(ref: FieldRef[Any], rows: Sequence[Context], missing: object) -> list[Any]:
+    """Validate one field across row contexts, with ``missing`` for absent keys.
+
+    Present values are normalized like :func:`context_values` does, so an
+    explicit ``None`` or ``NaN`` is rejected instead of read as missing.
+    """
+
+    name = ref.name
+    values: list[Any] = []
+    for ctx in rows:
+        raw = ctx.get(name, MISSING)
+        values.append(missing if raw is MISSING else ref.normalize_value(raw, role="Context value"))
+    return values
+
+
+def evaluate_contexts(ruleset: RuleSet[V], ctxs: Iterable[Context]) -> list[V]:
+    """Resolve many row contexts at once by transposing them into columns.
+
+    Args:
+        ruleset: Rule set definition to evaluate.
+        ctxs: Contexts to resolve.
+
+    Returns:
+        The resolved value for each context, in order.
+
+    Raises:
+        ValueError: If a context value is outside of its field domain.
+        LookupError: If no rule matches some context.
+    """
+
+    rows = ctxs if isinstance(ctxs, Sequence) else list(ctxs)
+    columns: dict[str, NDArray[Any]] = {}
+    for ref in ruleset.iter_field_refs():
+        if isinstance(ref, IntervalFieldRef):
+            columns[ref.name] = _interval_column(ref, _row_values(ref, rows, math.nan))
+        else:
+            assert isinstance(ref, DiscreteFieldRef)
+            # Validated discrete values are never ``None``, so it can stand
+            # for absent keys.
+            columns[ref.name] = _discrete_column(ref, _row_values(ref, rows, None))
+
+    return _evaluate(ruleset, ContextBatch(columns, size=len(rows)), "numpy")
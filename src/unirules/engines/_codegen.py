@@ -0,0 +1,350 @@
+"""
+Code generation for rulesets.
+
+This module lowers a :class:`RuleSet` into the syntax tree of a single Python
+function in which every condition is inlined as a plain expression, then
+compiles it without going through source text. Conditions are constant-folded
+first (see :mod:`unirules.engines._optimize`). The function receives the
+context values as a list ordered like :meth:`RuleSet.iter_field_refs`, so each
+field is bound to a local by position instead of being looked up by name. Runs
+of interval rules on a single field are replaced by a binary search over their
+bounds.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Any, Callable
+
+from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Context, Not, Or, dispatch_table
+from unirules.core.rules import RuleItem, RuleSet, RuleTree, RuleValue, V
+from unirules.domains.common.conditions import Eq
+from unirules.domains.discrete.conditions import In_, NotIn_
+from unirules.domains.interval.conditions import Between, Ge, Gt, IntervalCond, Le, Lt
+from unirules.engines._ctx_validation import MISSING
+from unirules.engines._optimize import fold_rules
+
+__all__ = ["build_resolver_ast", "compile_context_resolver", "compile_ruleset", "predicate_compiler"]
+
+_FUNC_NAME = "_resolve"
+
+# Shortest run of consecutive single-field interval rules worth indexing;
+# below this a couple of inlined comparisons beat a bisect call.
+_MIN_INDEXED_RUN = 4
+
+
+class _IntervalIndex:
+    """First-match lookup over interval rules on one field.
+
+    The distinct bounds split the real line into alternating point and open
+    gap regions. Every rule either contains a whole region or none of it, so
+    the first matching payload is precomputed per region and a lookup is a
+    single :func:`bisect.bisect_left` call.
+    """
+
+    __slots__ = ("bounds", "winners")
+
+    def __init__(self, rules: Sequence[tuple[IntervalCond, object]]) -> None:
+        """Build the index.
+
+        Args:
+            rules: ``(condition, payload)`` pairs in evaluation order.
+        """
+
+        self.bounds = sorted({b for cond, _ in rules for b in cond.bounds()})
+        # The outer gaps are sampled at infinity: a finite offset from the
+        # extreme bounds rounds back onto them for large magnitudes.
+        samples: list[float] = [-math.inf, self.bounds[0]]
+        for previous, bound in zip(self.bounds, self.bounds[1:]):
+            samples.extend((previous / 2 + bound / 2, bound))
+        samples.append(math.inf)
+
+        self.winners: list[object] = []
+        for sample in samples:
+            ctx = {rules[0][0].field.name: sample}
+            winner = next((payload for cond, payload in rules if cond.eval(ctx)), MISSING)
+            self.winners.append(winner)
+
+    def __call__(self, value: float) -> object:
+        """Return the payload of the first rule containing ``value`` or ``MISSING``."""
+
+        bounds = self.bounds
+        i = bisect_left(bounds, value)
+        if i < len(bounds) and bounds[i] == value:
+            return self.winners[2 * i + 1]
+        return self.winners[2 * i]
+
+
+def _load(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Load())
+
+
+def _compare(left: ast.expr, op: ast.cmpop, right: ast.expr) -> ast.Compare:
+    return ast.Compare(left=left, ops=[op], comparators=[right])
+
+
+def _no_match() -> ast.stmt:
+    message = ast.JoinedStr(
+        values=[
+            ast.Constant("No rule matched for ctx="),
+            ast.FormattedValue(value=_load("ctx"), conversion=ord("r"), format_spec=None),
+        ]
+    )
+    return ast.Raise(exc=ast.Call(func=_load("LookupError"), args=[message], keywords=[]), cause=None)
+
+
+class _AstBuilder(CondVisitor[ast.expr]):
+    """Accumulate the syntax tree and globals of a generated resolve function."""
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.namespace: dict[str, Any] = {"_MISSING": MISSING}
+        self.payloads: list[object] = []
+        self._vars = {name: f"_v{i}" for i, name in enumerate(fields)}
+        self._counter = 0
+
+    def _bind(self, prefix: str, value: object) -> ast.Name:
+        name = f"_{prefix}{self._counter}"
+        self._counter += 1
+        self.namespace[name] = value
+        return _load(name)
+
+    def var(self, field_name: str) -> ast.Name:
+        """Return a reference to the local holding the value of ``field_name``."""
+
+        return _load(self._vars[field_name])
+
+    def expr(self, cond: Cond) -> ast.expr:
+        return _EMIT[cond.KIND](self, cond)
+
+    def payload(self, value: object) -> ast.expr:
+        """Return an expression loading ``value`` from the payload table."""
+
+        self.payloads.append(value)
+        return ast.Subscript(value=_load("_PAYLOADS"), slice=ast.Constant(len(self.payloads) - 1), ctx=ast.Load())
+
+    def _present(self, cond: IntervalCond, test: ast.expr) -> ast.expr:
+        var = self.var(cond.field.name)
+        return ast.BoolOp(op=ast.And(), values=[_compare(var, ast.IsNot(), _load("_MISSING")), test])
+
+    def visit_eq(self, cond: Eq) -> ast.expr:
+        return _compare(self.var(cond.field.name), ast.Eq(), self._bind("k", cond.value))
+
+    def visit_in(self, cond: In_) -> ast.expr:
+        return _compare(self.var(cond.field.name), ast.In(), self._bind("k", cond.items))
+
+    def visit_notin(self, cond: NotIn_) -> ast.expr:
+        return _compare(self.var(cond.field.name), ast.NotIn(), self._bind("k", cond.items))
+
+    def visit_between(self, cond: Between) -> ast.expr:
+        test = ast.Compare(
+            left=ast.Constant(cond.lo),
+            ops=[ast.Lt() if cond.left_closed else ast.LtE(), ast.Lt() if cond.right_closed else ast.LtE()],
+            comparators=[self.var(cond.field.name), ast.Constant(cond.hi)],
+        )
+        return self._present(cond, test)
+
+    def visit_gt(self, cond: Gt) -> ast.expr:
+        return self._present(cond, _compare(self.var(cond.field.name), ast.Gt(), ast.Constant(cond.value)))
+
+    def visit_ge(self, cond: Ge) -> ast.expr:
+        return self._present(cond, _compare(self.var(cond.field.name), ast.GtE(), ast.Constant(cond.value)))
+
+    def visit_lt(self, cond: Lt) -> ast.expr:
+        return self._present(cond, _compare(self.var(cond.field.name), ast.Lt(), ast.Constant(cond.value)))
+
+    def visit_le(self, cond: Le) -> ast.expr:
+        return self._present(cond, _compare(self.var(cond.field.name), ast.LtE(), ast.Constant(cond.value)))
+
+    def visit_and(self, cond: And) -> ast.expr:
+        return ast.BoolOp(op=ast.And(), values=[self.expr(cond.a), self.expr(cond.b)])
+
+    def visit_or(self, cond: Or) -> ast.expr:
+        return ast.BoolOp(op=ast.Or(), values=[self.expr(cond.a), self.expr(cond.b)])
+
+    def visit_not(self, cond: Not) -> ast.expr:
+        return ast.UnaryOp(op=ast.Not(), operand=self.expr(cond.a))
+
+    def visit_always_true(self, cond: AlwaysTrue) -> ast.expr:  # noqa: ARG002 - signature required
+        return ast.Constant(True)
+
+    def predicate(self, cond: Cond) -> Callable[..., bool]:
+        """Compile ``cond`` into a function taking every field value positionally."""
+
+        args = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=var) for var in self._vars.values()],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        )
+        tree = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=args, body=self.expr(cond))))
+        result: Callable[..., bool] = eval(compile(tree, "<unirules condition>", "eval"), self.namespace)
+        return result
+
+    def ruleset_body(self, ruleset: RuleSet[V]) -> list[ast.stmt]:
+        """Return the statements resolving ``ruleset``.
+
+        Args:
+            ruleset: Rule set to lower.
+
+        Returns:
+            Statements returning the matched payload or raising ``LookupError``.
+        """
+
+        body: list[ast.stmt] = []
+        rules = fold_rules(ruleset)
+        start = 0
+        while start < len(rules):
+            run = _interval_run(rules, start)
+            if len(run) >= _MIN_INDEXED_RUN:
+                body.append(self._index_lookup(run))
+                start += len(run)
+                continue
+            rule = rules[start]
+            start += 1
+            if isinstance(rule, RuleValue):
+                then: list[ast.stmt] = [ast.Return(value=self.payload(rule.value))]
+            else:
+                assert isinstance(rule, RuleTree)
+                then = self.ruleset_body(rule.subtree)
+            if isinstance(rule.condition, AlwaysTrue):
+                # Folding dropped every rule behind this one.
+                body.extend(then)
+                return body
+            body.append(ast.If(test=self.expr(rule.condition), body=then, orelse=[]))
+        body.append(_no_match())
+        return body
+
+    def _index_lookup(self, run: list[tuple[IntervalCond, object]]) -> ast.stmt:
+        var = self.var(run[0][0].field.name)
+        lookup = self._bind("x", _IntervalIndex(run))
+        found = ast.Name(id="_r", ctx=ast.Store())
+        return ast.If(
+            test=_compare(var, ast.IsNot(), _load("_MISSING")),
+            body=[
+                ast.Assign(targets=[found], value=ast.Call(func=lookup, args=[var], keywords=[])),
+                ast.If(
+                    test=_compare(_load("_r"), ast.IsNot(), _load("_MISSING")),
+                    body=[ast.Return(value=_load("_r"))],
+                    orelse=[],
+                ),
+            ],
+            orelse=[],
+        )
+
+    def function(self, body: list[ast.stmt]) -> ast.FunctionDef:
+        """Wrap ``body`` in the resolve function, unpacking every field value once."""
+
+        reads: list[ast.stmt] = []
+        if self._vars:
+            targets: list[ast.expr] = [ast.Name(id=var, ctx=ast.Store()) for var in self._vars.values()]
+            reads.append(ast.Assign(targets=[ast.Tuple(elts=targets, ctx=ast.Store())], value=_load("values")))
+        func = ast.FunctionDef(
+            name=_FUNC_NAME,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg="values"), ast.arg(arg="ctx")],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=reads + body,
+            decorator_list=[],
+            returns=None,
+        )
+        if "type_params" in ast.FunctionDef._fields:  # Python 3.12+
+            func.type_params = []  # type: ignore[attr-defined,unused-ignore]
+        return func
+
+
+_EMIT = dispatch_table(_AstBuilder)
+
+
+def predicate_compiler(ruleset: RuleSet[V]) -> Callable[[Cond], Callable[..., bool]]:
+    """Return a function compiling conditions of ``ruleset`` into predicates.
+
+    Each predicate takes the values of every field of the rule set
+    positionally, ordered like :meth:`RuleSet.iter_field_refs`, and returns
+    whether the condition holds. Predicates compiled by the same function
+    share one globals namespace holding the constants they compare against.
+    """
+
+    return _AstBuilder(ruleset._field_names).predicate
+
+
+def _interval_run(rules: Sequence[RuleItem[V]], start: int) -> list[tuple[IntervalCond, object]]:
+    """Return the interval value rules on one field starting at ``start``."""
+
+    run: list[tuple[IntervalCond, object]] = []
+    for rule in rules[start:]:
+        cond = rule.condition
+        if not isinstance(rule, RuleValue) or not isinstance(cond, IntervalCond):
+            break
+        if run and cond.field.name != run[0][0].field.name:
+            break
+        run.append((cond, rule.value))
+    return run
+
+
+def build_resolver_ast(ruleset: RuleSet[V]) -> tuple[ast.FunctionDef, dict[str, Any]]:
+    """Build the syntax tree of the resolve function for a rule set.
+
+    Matched values are loaded from a ``_PAYLOADS`` tuple; other objects the
+    conditions compare against are bound to generated global names.
+
+    Args:
+        ruleset: Rule set definition to lower.
+
+    Returns:
+        The function definition and the globals it must be executed with.
+    """
+
+    builder = _AstBuilder(ruleset._field_names)
+    body = builder.ruleset_body(ruleset)
+    namespace = builder.namespace
+    namespace["_PAYLOADS"] = tuple(builder.payloads)
+    return builder.function(body), namespace
+
+
+def compile_ruleset(ruleset: RuleSet[V]) -> Callable[[Sequence[object], object], V]:
+    """Generate and compile a resolve function for a rule set.
+
+    The generated function takes the validated field values ordered like
+    :meth:`RuleSet.iter_field_refs` (``MISSING`` for absent fields) and the
+    context they came from, which is only used in the error message. It walks
+    the rules with all conditions inlined and returns the matched value or
+    raises :class:`LookupError` when nothing matches.
+
+    Args:
+        ruleset: Rule set definition to compile.
+
+    Returns:
+        Callable resolving already validated field values.
+    """
+
+    func, namespace = build_resolver_ast(ruleset)
+    module = ast.fix_missing_locations(ast.Module(body=[func], type_ignores=[]))
+    exec(compile(module, f"<unirules ruleset {id(ruleset):#x}>", "exec"), namespace)
+    return namespace[_FUNC_NAME]
+
+
+def compile_context_resolver(ruleset: RuleSet[V]) -> Callable[[Context], V]:
+    """Wrap the compiled resolve function to accept a validated context.
+
+    Args:
+        ruleset: Rule set definition to compile.
+
+    Returns:
+        Callable reading the field values from a context and resolving them.
+    """
+
+    resolve = ruleset._cached("resolve", compile_ruleset)
+    names = ruleset._field_names
+
+    def resolve_context(ctx: Context) -> V:
+        return resolve([ctx.get(name, MISSING) for name in names], ctx)
+
+    return resolve_context
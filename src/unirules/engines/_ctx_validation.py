@@ -1,23 +1,154 @@
 from __future__ import annotations
 
+from typing import Any, Callable, ClassVar
+
 from unirules.core.conditions import Context
 from unirules.core.rules import RuleSet, V
 
-__all__ = ["validate_context"]
+__all__ = [
+    "MISSING",
+    "ContextRecord",
+    "build_context_class",
+    "context_values",
+    "record_values",
+    "validate_context",
+]
+
+Normalizer = Callable[..., object]
+
+# Placeholder for fields absent from a context in positional value lists.
+MISSING = object()
+
+
+def _validation_plan(ruleset: RuleSet[V]) -> tuple[tuple[str, Normalizer], ...]:
+    """Collect the normalizer of every unique field used by a ruleset."""
+
+    return tuple((field.name, field.normalize_value) for field in ruleset.iter_field_refs())
+
+
+def context_values(ruleset: RuleSet[V], ctx: Context) -> list[object]:
+    """Validate a context and return its values in field index order.
+
+    Values are ordered like :meth:`RuleSet.iter_field_refs`, normalized, and
+    ``MISSING`` for fields absent from the context. Every field is looked up
+    and validated exactly once, so compiled resolvers can read values by
+    position.
+
+    Raises:
+        ValueError: If a context value is outside of its field domain.
+    """
+
+    plan = ruleset._cached("fields", _validation_plan)
+    if not ctx:
+        return [MISSING] * len(plan)
+    values: list[object] = []
+    for name, normalize in plan:
+        raw = ctx.get(name, MISSING)
+        values.append(raw if raw is MISSING else normalize(raw, role="Context value"))
+    return values
+
+
+def record_values(ruleset: RuleSet[V], record: ContextRecord) -> list[object]:
+    """Validate a :class:`ContextRecord` and return its values in field index order.
+
+    Unset attributes are ``MISSING``, like keys absent from a mapping context.
+
+    Raises:
+        ValueError: If a context value is outside of its field domain.
+    """
+
+    values: list[object] = []
+    for name, normalize in ruleset._cached("fields", _validation_plan):
+        raw = getattr(record, name, MISSING)
+        values.append(raw if raw is MISSING else normalize(raw, role="Context value"))
+    return values
+
+
+class ContextRecord:
+    """Base class of the slotted context classes built for rule sets.
+
+    Subclasses declare one slot per field in :attr:`fields`; attributes that
+    are never set count as missing fields.
+    """
+
+    __slots__ = ()
+
+    fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, **values: object) -> None:
+        for name, value in values.items():
+            if name not in self.fields:
+                raise TypeError(f"{type(self).__name__}() got an unexpected field {name!r}")
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields if hasattr(self, name))
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> tuple[Callable[..., ContextRecord], tuple[tuple[str, ...], dict[str, object]]]:
+        # Generated classes cannot be looked up by name, so records pickle as
+        # their field names and set values and are rebuilt on load.
+        values = {name: getattr(self, name) for name in self.fields if hasattr(self, name)}
+        return _restore_record, (self.fields, values)
+
+
+# Record classes by field names, shared by rule sets reading the same fields.
+_RECORD_CLASSES: dict[tuple[str, ...], type[ContextRecord]] = {}
+
+
+def _record_class(names: tuple[str, ...]) -> type[ContextRecord]:
+    try:
+        return _RECORD_CLASSES[names]
+    except KeyError:
+        pass
+    for name in names:
+        if not name.isidentifier() or name.startswith("__") or name == "fields":
+            raise ValueError(f"Field name {name!r} cannot be used as a context attribute")
+    namespace = {"__slots__": names, "fields": names, "__module__": __name__}
+    cls = _RECORD_CLASSES[names] = type("Context", (ContextRecord,), namespace)
+    return cls
+
+
+def _restore_record(names: tuple[str, ...], values: dict[str, object]) -> ContextRecord:
+    return _record_class(names)(**values)
+
+
+def build_context_class(ruleset: RuleSet[Any]) -> type[ContextRecord]:
+    """Create a :class:`ContextRecord` subclass with a slot per field of ``ruleset``.
+
+    Raises:
+        ValueError: If a field name is not a valid attribute name.
+    """
+
+    return _record_class(ruleset._field_names)
 
 
 def validate_context(ruleset: RuleSet[V], ctx: Context) -> Context:
-    """Validate that context values satisfy all conditions in a ruleset."""
+    """Validate that context values satisfy all conditions in a ruleset.
+
+    The context is returned as is when every value is already in normalized
+    form; otherwise a copy with the coerced values is returned.
+    """
 
     if not ctx:
         return ctx
 
-    normalized: dict[str, object] = dict(ctx)
-    seen_names: set[str] = set()
-    for field in ruleset.iter_field_refs():
-        name = field.name
-        if name in seen_names or name not in ctx:
+    if not ruleset._needs_normalization:
+        # Values come back unchanged, so only check them and keep ``ctx``.
+        for field in ruleset.iter_field_refs():
+            value = ctx.get(field.name, MISSING)
+            if value is not MISSING:
+                field.validate_value(value, role="Context value")
+        return ctx
+
+    changes: dict[str, object] = {}
+    for name, normalize in ruleset._cached("fields", _validation_plan):
+        raw = ctx.get(name, MISSING)
+        if raw is MISSING:
             continue
-        seen_names.add(name)
-        normalized[name] = field.normalize_value(ctx[name], role="Context value")
-    return normalized
+        value = normalize(raw, role="Context value")
+        if value is not raw:
+            changes[name] = value
+    if not changes:
+        return ctx
+    return {**ctx, **changes}
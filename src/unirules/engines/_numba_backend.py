@@ -0,0 +1,183 @@
+"""
+Numba backend for batch evaluation of interval-only rulesets.
+
+Rulesets whose conditions only compare interval fields reduce to a cascade of
+float comparisons. This module generates a loop over the batch rows with that
+cascade inlined, compiles it with :func:`numba.njit`, and returns the index of
+the matched payload for every row. Missing values are encoded as ``NaN``: every
+comparison against ``NaN`` is false, so a missing field never satisfies an
+interval condition, which mirrors the scalar resolver.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Not, Or, dispatch_table
+from unirules.core.rules import RuleSet, RuleTree, RuleValue, V
+from unirules.domains.common.conditions import Eq
+from unirules.domains.discrete.conditions import In_, NotIn_
+from unirules.domains.interval.conditions import Between, Ge, Gt, Le, Lt
+from unirules.domains.interval.field_ref import IntervalFieldRef
+
+__all__ = ["NumbaKernel", "compile_kernel"]
+
+_FUNC_NAME = "_kernel"
+_INDENT = "    "
+
+
+class _NotInterval(Exception):
+    """Raised when a condition cannot be lowered to float comparisons."""
+
+
+class NumbaKernel:
+    """Compiled batch kernel together with its argument layout.
+
+    Attributes:
+        fields: Field names in the order the kernel expects their columns.
+        payloads: Rule values indexed by the kernel output.
+        func: Jitted function filling an ``int32`` array with payload indices,
+            or ``-1`` for rows without a match.
+    """
+
+    __slots__ = ("fields", "payloads", "func")
+
+    def __init__(self, fields: tuple[str, ...], payloads: list[Any], func: Callable[..., None]) -> None:
+        self.fields = fields
+        self.payloads = payloads
+        self.func = func
+
+
+class _KernelBuilder(CondVisitor[str]):
+    """Generate the source of the row loop for an interval-only ruleset."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.payloads: list[Any] = []
+        self._vars: dict[str, str] = {}
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names in the order of the generated column arguments."""
+
+        return tuple(self._vars)
+
+    def var(self, field_name: str) -> str:
+        try:
+            return self._vars[field_name]
+        except KeyError:
+            var = f"v{len(self._vars)}"
+            self._vars[field_name] = var
+            return var
+
+    def expr(self, cond: Cond) -> str:
+        return _EMIT[cond.KIND](self, cond)
+
+    def visit_eq(self, cond: Eq) -> str:
+        if not isinstance(cond.field, IntervalFieldRef):
+            raise _NotInterval(cond)
+        return f"({self.var(cond.field.name)} == {cond.field.coerce(cond.value, role='Condition value')!r})"
+
+    def visit_in(self, cond: In_) -> str:
+        raise _NotInterval(cond)
+
+    def visit_notin(self, cond: NotIn_) -> str:
+        raise _NotInterval(cond)
+
+    def visit_between(self, cond: Between) -> str:
+        lo_op = "<" if cond.left_closed else "<="
+        hi_op = "<" if cond.right_closed else "<="
+        return f"({cond.lo!r} {lo_op} {self.var(cond.field.name)} {hi_op} {cond.hi!r})"
+
+    def visit_gt(self, cond: Gt) -> str:
+        return f"({self.var(cond.field.name)} > {cond.value!r})"
+
+    def visit_ge(self, cond: Ge) -> str:
+        return f"({self.var(cond.field.name)} >= {cond.value!r})"
+
+    def visit_lt(self, cond: Lt) -> str:
+        return f"({self.var(cond.field.name)} < {cond.value!r})"
+
+    def visit_le(self, cond: Le) -> str:
+        return f"({self.var(cond.field.name)} <= {cond.value!r})"
+
+    def visit_and(self, cond: And) -> str:
+        return f"({self.expr(cond.a)} and {self.expr(cond.b)})"
+
+    def visit_or(self, cond: Or) -> str:
+        return f"({self.expr(cond.a)} or {self.expr(cond.b)})"
+
+    def visit_not(self, cond: Not) -> str:
+        return f"(not {self.expr(cond.a)})"
+
+    def visit_always_true(self, cond: AlwaysTrue) -> str:  # noqa: ARG002 - signature required
+        return "True"
+
+    def emit_ruleset(self, ruleset: RuleSet[V], depth: int) -> None:
+        """Append an ``if``/``elif`` chain assigning payload indices."""
+
+        pad = _INDENT * depth
+        if not ruleset._ordered:
+            self.lines.append(f"{pad}pass")
+            return
+        keyword = "if"
+        for _, rule in ruleset._ordered:
+            self.lines.append(f"{pad}{keyword} {self.expr(rule.condition)}:")
+            keyword = "elif"
+            if isinstance(rule, RuleValue):
+                self.lines.append(f"{pad}{_INDENT}out[i] = {len(self.payloads)}")
+                self.payloads.append(rule.value)
+            else:
+                assert isinstance(rule, RuleTree)
+                self.emit_ruleset(rule.subtree, depth + 1)
+
+    def source(self) -> str:
+        """Return the complete source of the generated kernel."""
+
+        columns = [f"c{i}" for i in range(len(self._vars))]
+        lines = [
+            f"def {_FUNC_NAME}({', '.join([*columns, 'out'])}):",
+            f"{_INDENT}for i in range(out.shape[0]):",
+            f"{_INDENT * 2}out[i] = -1",
+        ]
+        lines.extend(f"{_INDENT * 2}{var} = {column}[i]" for var, column in zip(self._vars.values(), columns))
+        return "\n".join(lines + self.lines) + "\n"
+
+
+_EMIT = dispatch_table(_KernelBuilder)
+
+
+def _build(ruleset: RuleSet[V]) -> _KernelBuilder:
+    builder = _KernelBuilder()
+    builder.emit_ruleset(ruleset, depth=2)
+    return builder
+
+
+def compile_kernel(ruleset: RuleSet[V]) -> NumbaKernel:
+    """Generate and jit-compile the batch kernel for an interval-only ruleset.
+
+    Args:
+        ruleset: Rule set definition to compile.
+
+    Returns:
+        The compiled kernel and its argument layout.
+
+    Raises:
+        ImportError: If ``numba`` is not installed.
+        ValueError: If the rule set contains non-interval conditions.
+    """
+
+    try:
+        from numba import njit  # type: ignore[import-not-found,import-untyped,unused-ignore]  # noqa: PLC0415
+    except ImportError as exc:
+        raise ImportError("The numba backend requires the optional 'numba' dependency") from exc
+
+    try:
+        builder = _build(ruleset)
+    except _NotInterval as exc:
+        raise ValueError(f"The numba backend only supports interval conditions, got {exc.args[0]!r}") from None
+
+    namespace: dict[str, Any] = {}
+    exec(compile(builder.source(), f"<unirules kernel {id(ruleset):#x}>", "exec"), namespace)
+    func = njit(nogil=True)(namespace[_FUNC_NAME])
+    return NumbaKernel(fields=builder.fields, payloads=builder.payloads, func=func)
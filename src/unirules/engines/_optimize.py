@@ -0,0 +1,136 @@
+"""
+Compile-time simplification of rule conditions.
+
+Conditions are pure, so parts whose outcome is known without a context can be
+folded before code generation: ``And``/``Or``/``Not`` over constant operands,
+empty membership tests, empty intervals and comparisons that no value of the
+field domain can satisfy. Rules whose condition folds to false are dropped,
+and rules behind one whose condition folds to true can never be reached.
+
+The rule set itself is left untouched: explanations and analysis report the
+rules as they were written.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Not, Or, dispatch_table
+from unirules.core.rules import RuleItem, RuleSet, V
+from unirules.domains.common.conditions import Eq
+from unirules.domains.discrete.conditions import In_, NotIn_
+from unirules.domains.interval.conditions import Between, Ge, Gt, Le, Lt
+
+__all__ = ["FALSE", "TRUE", "fold", "fold_rules"]
+
+TRUE: Cond = AlwaysTrue()
+# Canonical condition that never holds.
+FALSE: Cond = Not(TRUE)
+
+
+def _is_false(cond: Cond) -> bool:
+    return isinstance(cond, Not) and isinstance(cond.a, AlwaysTrue)
+
+
+class _Folder(CondVisitor[Cond]):
+    """Return a simplified condition with the same outcome for every context."""
+
+    def visit_eq(self, cond: Eq) -> Cond:
+        return cond
+
+    def visit_in(self, cond: In_) -> Cond:
+        return cond if cond.items else FALSE
+
+    def visit_notin(self, cond: NotIn_) -> Cond:
+        return cond if cond.items else TRUE
+
+    def visit_between(self, cond: Between) -> Cond:
+        if cond.lo == cond.hi and (cond.left_closed or cond.right_closed):
+            return FALSE
+        return cond
+
+    def visit_gt(self, cond: Gt) -> Cond:
+        return FALSE if cond.value >= cond.field.domain.hi else cond
+
+    def visit_ge(self, cond: Ge) -> Cond:
+        return FALSE if cond.value > cond.field.domain.hi else cond
+
+    def visit_lt(self, cond: Lt) -> Cond:
+        return FALSE if cond.value <= cond.field.domain.lo else cond
+
+    def visit_le(self, cond: Le) -> Cond:
+        return FALSE if cond.value < cond.field.domain.lo else cond
+
+    def visit_and(self, cond: And) -> Cond:
+        a, b = fold(cond.a), fold(cond.b)
+        if _is_false(a) or _is_false(b):
+            return FALSE
+        if isinstance(a, AlwaysTrue):
+            return b
+        if isinstance(b, AlwaysTrue):
+            return a
+        return cond if a is cond.a and b is cond.b else And(a, b)
+
+    def visit_or(self, cond: Or) -> Cond:
+        a, b = fold(cond.a), fold(cond.b)
+        if isinstance(a, AlwaysTrue) or isinstance(b, AlwaysTrue):
+            return TRUE
+        if _is_false(a):
+            return b
+        if _is_false(b):
+            return a
+        return cond if a is cond.a and b is cond.b else Or(a, b)
+
+    def visit_not(self, cond: Not) -> Cond:
+        a = fold(cond.a)
+        if isinstance(a, AlwaysTrue):
+            return FALSE
+        if isinstance(a, Not):
+            return a.a
+        return cond if a is cond.a else Not(a)
+
+    def visit_always_true(self, cond: AlwaysTrue) -> Cond:
+        return cond
+
+
+_FOLD = dispatch_table(_Folder)
+_FOLDER = _Folder()
+
+
+def fold(cond: Cond) -> Cond:
+    """Simplify a condition without changing its outcome for any context.
+
+    Args:
+        cond: Condition to simplify.
+
+    Returns:
+        An equivalent condition, ``cond`` itself when nothing folds. Constant
+        outcomes are returned as :class:`AlwaysTrue` or :data:`FALSE`.
+    """
+
+    return _FOLD[cond.KIND](_FOLDER, cond)
+
+
+def fold_rules(ruleset: RuleSet[V]) -> list[RuleItem[V]]:
+    """Return the reachable rules of a rule set in evaluation order.
+
+    Conditions are folded; rules that can never match are dropped, and so are
+    rules after one that always matches. Rules whose condition does not fold
+    are returned as is; others are copies sharing the value or subtree.
+
+    Args:
+        ruleset: Rule set to simplify.
+
+    Returns:
+        The rules a resolver has to test, in order.
+    """
+
+    rules: list[RuleItem[V]] = []
+    for _, rule in ruleset._ordered:
+        cond = fold(rule.condition)
+        if _is_false(cond):
+            continue
+        rules.append(rule if cond is rule.condition else replace(rule, condition=cond))
+        if isinstance(cond, AlwaysTrue):
+            break
+    return rules
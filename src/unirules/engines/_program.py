@@ -0,0 +1,157 @@
+"""
+Flat instruction programs for rulesets.
+
+A :class:`Program` is the rule tree lowered into parallel arrays of
+instructions: an opcode, an integer operand, a constant, and a jump target per
+instruction. The condition of every rule is compiled once into a predicate
+over the positional field values (see :func:`predicate_compiler`), so testing
+a rule is a single call instead of a walk over condition objects. Running the
+program is a single ``while`` loop over the arrays.
+
+Besides the tests, the program contains markers recording which rule matched
+or failed at which nesting depth; :meth:`Program.explain` uses them to
+reconstruct the evaluation trace. Plain resolution never runs a program: it
+uses the function generated by :mod:`unirules.engines._codegen`, which has no
+trace bookkeeping at all.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional
+
+from unirules.core.conditions import AlwaysTrue, Cond
+from unirules.core.rules import RuleSet, RuleTree, RuleValue, V
+from unirules.engines._codegen import predicate_compiler
+
+__all__ = ["Program", "compile_program"]
+
+_TEST = 0  # call predicate ``consts[pc]``, jump to ``jumps[pc]`` when false
+_MATCHED = 1  # rule ``consts[pc]`` matched at depth ``args[pc]``
+_FAILED = 2  # top-level rule ``consts[pc]`` did not match
+_EMIT = 3  # return payload ``consts[pc]``
+_NO_MATCH = 4  # no rule matched at depth ``args[pc]``
+
+
+def _label(rule: Any) -> str:
+    return getattr(rule, "name", None) or "<rule>"
+
+
+@dataclass(frozen=True)
+class Program(Generic[V]):
+    """Rule set lowered into parallel instruction arrays.
+
+    Attributes:
+        fields: Names of the context fields, ordered like
+            :meth:`RuleSet.iter_field_refs`.
+        ops: Opcode of each instruction.
+        args: Nesting depth of marker instructions.
+        consts: Constant operand per instruction.
+        jumps: Jump target per instruction, ``-1`` when unused.
+    """
+
+    fields: tuple[str, ...]
+    ops: array[int]
+    args: array[int]
+    consts: tuple[Any, ...]
+    jumps: array[int]
+
+    def explain(self, values: Sequence[object]) -> tuple[Optional[str], list[str], list[tuple[str, bool]], Optional[V]]:
+        """Run the program against validated field values and record the trace.
+
+        Args:
+            values: Field values ordered like :attr:`fields`, ``MISSING`` for
+                absent fields.
+
+        Returns:
+            The matched top-level rule label, the path of matched labels, the
+            label and outcome of each tested top-level rule, and the resolved
+            value.
+        """
+
+        ops, args, consts, jumps = self.ops, self.args, self.consts, self.jumps
+        tested: list[tuple[str, bool]] = []
+        path: list[str] = []
+        pc = 0
+        while True:
+            op = ops[pc]
+            if op == _TEST:
+                pc = pc + 1 if consts[pc](*values) else jumps[pc]
+            elif op == _MATCHED:
+                if args[pc] == 0:
+                    tested.append((consts[pc], True))
+                path.append(consts[pc])
+                pc += 1
+            elif op == _FAILED:
+                tested.append((consts[pc], False))
+                pc += 1
+            elif op == _EMIT:
+                return path[0], path, tested, consts[pc]
+            else:
+                # No match at the top level means nothing matched at all; a
+                # nested miss ends the explanation at the matched parent.
+                return (path[0] if path else None), path, tested, None
+
+
+class _ProgramBuilder:
+    """Emit instructions for a rule set."""
+
+    def __init__(self, ruleset: RuleSet[V]) -> None:
+        self.ops = array("B")
+        self.args = array("i")
+        self.consts: list[Any] = []
+        self.jumps = array("i")
+        self._labels: list[int] = []
+        self._predicate: Callable[[Cond], Callable[..., bool]] = predicate_compiler(ruleset)
+
+    def new_label(self) -> int:
+        self._labels.append(-1)
+        return len(self._labels) - 1
+
+    def place(self, label: int) -> None:
+        self._labels[label] = len(self.ops)
+
+    def emit(self, op: int, arg: int = 0, const: Any = None, jump: int = -1) -> None:
+        self.ops.append(op)
+        self.args.append(arg)
+        self.consts.append(const)
+        self.jumps.append(jump)
+
+    def ruleset(self, ruleset: RuleSet[V], depth: int) -> None:
+        """Emit the instructions resolving ``ruleset`` at a nesting depth."""
+
+        for _, rule in ruleset._ordered:
+            failed = self.new_label()
+            if not isinstance(rule.condition, AlwaysTrue):
+                self.emit(_TEST, depth, self._predicate(rule.condition), failed)
+            self.emit(_MATCHED, depth, _label(rule))
+            if isinstance(rule, RuleValue):
+                self.emit(_EMIT, depth, rule.value)
+            else:
+                assert isinstance(rule, RuleTree)
+                self.ruleset(rule.subtree, depth + 1)
+            self.place(failed)
+            if depth == 0:
+                self.emit(_FAILED, depth, _label(rule))
+        self.emit(_NO_MATCH, depth)
+
+    def build(self, fields: tuple[str, ...]) -> Program[Any]:
+        jumps = array("i", (self._labels[j] if j >= 0 else -1 for j in self.jumps))
+        return Program(fields=fields, ops=self.ops, args=self.args, consts=tuple(self.consts), jumps=jumps)
+
+
+def compile_program(ruleset: RuleSet[V]) -> Program[V]:
+    """Lower a rule set into a flat :class:`Program`.
+
+    Args:
+        ruleset: Rule set definition to compile.
+
+    Returns:
+        The compiled program.
+    """
+
+    builder = _ProgramBuilder(ruleset)
+    builder.ruleset(ruleset, depth=0)
+    return builder.build(ruleset._field_names)
@@ -12,9 +12,9 @@ from typing import Generic, Mapping, Optional, Union, cast, overload
 
 from typing_extensions import TypeAlias
 
-from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Context, Not, Or
+from unirules.core.conditions import AlwaysTrue, And, Cond, CondVisitor, Context, Not, Or, dispatch_table
 from unirules.core.domains import ValueSet
-from unirules.core.rules import RuleItem, RuleSet, RuleSetPolicy, RuleTree, RuleValue, V
+from unirules.core.rules import RuleItem, RuleSet, RuleTree, RuleValue, V
 from unirules.domains.common.conditions import Eq
 from unirules.domains.discrete.conditions import In_, NotIn_
 from unirules.domains.discrete.domain import DiscreteDomain
@@ -51,6 +51,7 @@ class _Bot:
 
 TOP = _Top()
 BOT = _Bot()
+_MISSING = object()
 
 ProjectionResult: TypeAlias = Union[ValueSet, _Top, _Bot]
 
@@ -68,9 +69,12 @@ class ProjectionVisitor(CondVisitor[ProjectionResult]):
         self.ctx = ctx
 
     def _ctx_get(self, name: str) -> tuple[bool, Optional[object]]:
-        if self.ctx is None or name not in self.ctx:
+        if self.ctx is None:
             return (False, None)
-        return (True, self.ctx[name])
+        v = self.ctx.get(name, _MISSING)
+        if v is _MISSING:
+            return (False, None)
+        return (True, v)
 
     def visit_eq(self, cond: Eq) -> ProjectionResult:
         if cond.field.name == self.target:
@@ -203,8 +207,8 @@ class ProjectionVisitor(CondVisitor[ProjectionResult]):
         return TOP if ctx_val <= threshold else BOT
 
     def visit_and(self, cond: And) -> ProjectionResult:
-        a = cond.a.accept(self)
-        b = cond.b.accept(self)
+        a = _PROJECT[cond.a.KIND](self, cond.a)
+        b = _PROJECT[cond.b.KIND](self, cond.b)
         if a is BOT or b is BOT:
             return BOT
         if a is TOP:
@@ -216,8 +220,8 @@ class ProjectionVisitor(CondVisitor[ProjectionResult]):
         return a.inter(b)
 
     def visit_or(self, cond: Or) -> ProjectionResult:
-        a = cond.a.accept(self)
-        b = cond.b.accept(self)
+        a = _PROJECT[cond.a.KIND](self, cond.a)
+        b = _PROJECT[cond.b.KIND](self, cond.b)
         if a is TOP or b is TOP:
             return TOP
         if a is BOT:
@@ -229,7 +233,7 @@ class ProjectionVisitor(CondVisitor[ProjectionResult]):
         return a.union(b)
 
     def visit_not(self, cond: Not) -> ProjectionResult:
-        p = cond.a.accept(self)
+        p = _PROJECT[cond.a.KIND](self, cond.a)
         if p is TOP:
             return BOT
         if p is BOT:
@@ -242,6 +246,9 @@ class ProjectionVisitor(CondVisitor[ProjectionResult]):
         return TOP
 
 
+_PROJECT = dispatch_table(ProjectionVisitor)
+
+
 def project(
     cond: Cond,
     *,
@@ -269,7 +276,7 @@ def project(
         ProjectionResult: The projected domain or :data:`TOP`/:data:`BOT`.
     """
     visitor = ProjectionVisitor(target=target, target_domain=target_domain, ctx=ctx)
-    return cond.accept(visitor)
+    return _PROJECT[cond.KIND](visitor, cond)
 
 
 @dataclass
@@ -388,20 +395,18 @@ def _recursive_collect_domains(
     return domains
 
 
-def _ordered_rule_items(ruleset: RuleSet[V]) -> list[tuple[int, RuleItem[V]]]:
-    enumerated = list(enumerate(ruleset.rules))
-    policy = ruleset.policy
-    if policy is RuleSetPolicy.FIRST_WINS:
-        return enumerated
-    if policy is RuleSetPolicy.PRIORITY:
-        return sorted(enumerated, key=lambda pair: (-pair[1].priority, pair[0]))
-    raise ValueError(f"Unsupported ruleset policy: {policy!r}")
+# Number of ``(target, ctx)`` analyses an analyzer remembers.
+_ANALYSIS_CACHE_SIZE = 256
+
+_AnalysisKey = tuple[str, object, Optional[frozenset[tuple[str, object]]]]
 
 
 class Analyzer(Generic[V]):
     def __init__(self, ruleset: RuleSet[V]):
         self.ruleset = ruleset
-        self.domains = _recursive_collect_domains(ruleset=ruleset)
+        self.domains = ruleset._cached("domains", _recursive_collect_domains)
+        # Rule sets are immutable, so an analysis only depends on its inputs.
+        self._analysis_cache: dict[_AnalysisKey, AnalyzeResult[V]] = {}
 
     @overload
     def analyze(
@@ -446,6 +451,29 @@ class Analyzer(Generic[V]):
             result of the symbolic analysis.
         """
 
+        key: Optional[_AnalysisKey]
+        try:
+            key = (target.name, target.domain, None if ctx is None else frozenset(ctx.items()))
+        except TypeError:  # unhashable context values are analyzed afresh
+            key = None
+
+        result = self._analysis_cache.get(key) if key is not None else None
+        if result is None:
+            result = self._analyze(target, ctx)
+            if key is not None:
+                if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                    del self._analysis_cache[next(iter(self._analysis_cache))]
+                self._analysis_cache[key] = result
+        # Hand out a fresh result so callers cannot mutate the cached rule list.
+        fresh = type(result)(by_rule=list(result.by_rule), uncovered=result.uncovered)
+        return cast(Union[DiscreteAnalyzeResult[V], IntervalAnalyzeResult[V]], fresh)
+
+    def _analyze(
+        self,
+        target: Union[DiscreteField, IntervalField],
+        ctx: Optional[Context],
+    ) -> AnalyzeResult[V]:
+
         # Target comes as a Field; use it directly without extra checks
         target_name = target.name
         target_domain = target.domain
@@ -532,13 +560,13 @@ class Analyzer(Generic[V]):
             # RuleTree: dive into subtree with accumulated condition
             assert isinstance(item, RuleTree)
             new_prefix = _and(prefix, item.condition)
-            for sub_index, sub_item in _ordered_rule_items(item.subtree):
+            for sub_index, sub_item in item.subtree._ordered:
                 if remaining.is_empty():
                     break
                 process_item(sub_item, new_prefix, (*index_path, sub_index))
 
         # Traverse rules depth-first, preserving the original index path for outputs
-        for i, it in _ordered_rule_items(self.ruleset):
+        for i, it in self.ruleset._ordered:
             if remaining.is_empty():
                 break
             process_item(it, gfilter, (i,))
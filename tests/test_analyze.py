@@ -59,6 +59,29 @@ def test_discrete_analysis_filters_by_context() -> None:
     ]
 
 
+def test_repeated_analysis_is_cached_per_target_and_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Equal analyses are served from the cache as independent results."""
+
+    analyzer, country = _build_country_ruleset()
+    analyzed: list[object] = []
+    analyze = analyzer._analyze
+
+    def counting_analyze(target: Any, ctx: Any) -> Any:
+        analyzed.append(ctx)
+        return analyze(target, ctx)
+
+    monkeypatch.setattr(analyzer, "_analyze", counting_analyze)
+
+    first = analyzer.analyze(target=country, ctx={"program": "VIP"})
+    first.by_rule.clear()
+    second = analyzer.analyze(target=country, ctx={"program": "VIP"})
+
+    assert analyzed == [{"program": "VIP"}]
+    assert second.covered_values() == {"US", "RU", "IT", "NL"}
+    assert analyzer.analyze(target=country, ctx={"program": "STD"}).covered_values() == {"FR"}
+    assert analyzed == [{"program": "VIP"}, {"program": "STD"}]
+
+
 @pytest.mark.parametrize(
     "ctx",
     [
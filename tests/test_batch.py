@@ -0,0 +1,220 @@
+"""Vectorised batch evaluation tests."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from unirules import field, otherwise, ruleset, when
+from unirules.domains.discrete.domain import DiscreteDomain
+from unirules.domains.discrete.field_ref import DiscreteFieldRef
+
+from .credit_scoring import LoanDecision, build_credit_scoring_ruleset, credit_score
+
+np = pytest.importorskip("numpy")
+
+from unirules.core.contexts import ContextBatch  # noqa: E402 - requires numpy
+from unirules.engines._batch import _discrete_column  # noqa: E402 - requires numpy
+
+
+def _is_missing(value: object) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def test_evaluate_batch_matches_resolve() -> None:
+    """Batch evaluation yields the same decisions as row-wise resolution."""
+
+    rs = build_credit_scoring_ruleset()
+    rows = [
+        {"income_level": "HIGH", "credit_score": 750.0, "loan_purpose": "AUTO"},
+        {"income_level": "HIGH", "credit_score": 650.0, "loan_purpose": "PERSONAL"},
+        {"income_level": "HIGH", "credit_score": 400.0, "loan_purpose": "MORTGAGE"},
+        {"income_level": "MEDIUM", "credit_score": 450.0, "loan_purpose": "MORTGAGE"},
+        {"income_level": "LOW", "credit_score": 450.0, "loan_purpose": "AUTO"},
+        {"income_level": "LOW", "credit_score": 550.0, "loan_purpose": "AUTO"},
+        {"income_level": "HIGH", "credit_score": math.nan, "loan_purpose": None},
+    ]
+    data = {name: [row[name] for row in rows] for name in rows[0]}
+
+    resolver = rs.to_resolver()
+    expected = [resolver.resolve({k: v for k, v in row.items() if not _is_missing(v)}) for row in rows]
+
+    assert rs.evaluate_batch(data) == expected
+    assert expected[-1] == LoanDecision(decision="REVIEW", rate=7.0)
+
+
+def test_interval_eval_batch_respects_closed_endpoints() -> None:
+    """Interval masks agree with scalar evaluation on the boundaries."""
+
+    values = np.array([600.0, 650.0, 700.0, math.nan])
+    batch = ContextBatch({"credit_score": values})
+    for closed in ("none", "left", "right", "both"):
+        cond = credit_score.between(600, 700, closed=closed)
+        expected = [not _is_missing(v) and cond.eval({"credit_score": v}) for v in values]
+        assert cond.eval_batch(batch).tolist() == expected
+
+
+def test_context_batch_treats_absent_fields_as_missing() -> None:
+    """Conditions on fields without a column match no row."""
+
+    batch = ContextBatch({"income": np.array([1.0, 2.0])})
+
+    assert len(batch) == 1
+    assert batch.size == 2
+    assert credit_score.gt(600).eval_batch(batch).tolist() == [False, False]
+    with pytest.raises(ValueError, match="differ in length"):
+        ContextBatch({"a": np.zeros(2), "b": np.zeros(3)})
+
+
+def test_evaluate_batch_rejects_out_of_domain_values() -> None:
+    """Invalid column values raise the same ``ValueError`` as scalar resolution."""
+
+    status = field("status", domain=credit_score.domain)
+    rs = ruleset(when(status > 400).then("ok"))
+
+    with pytest.raises(ValueError, match="status"):
+        rs.evaluate_batch({"status": [500.0, 900.0]})
+    message = "Context value 900 for field 'status' is outside of allowed range"
+    with pytest.raises(ValueError) as scalar:
+        rs.to_resolver().resolve({"status": 900})
+    assert str(scalar.value) == message
+    for column in ([500, 900], np.array([500, 900])):
+        with pytest.raises(ValueError) as batch:
+            rs.evaluate_batch({"status": column})
+        assert str(batch.value) == message
+
+
+def test_evaluate_batch_keeps_rows_without_ruleset_fields() -> None:
+    """Rows whose columns are all unused by the rule set resolve as empty contexts."""
+
+    rs = build_credit_scoring_ruleset()
+    expected = rs.to_resolver().resolve({"other": 1})
+
+    assert rs.evaluate_batch({"other": [1, 2, 3]}) == [expected] * 3
+    assert ruleset(otherwise("x")).evaluate_batch({"other": [1, 2, 3]}) == ["x"] * 3
+    with pytest.raises(ValueError, match="differ in length"):
+        rs.evaluate_batch({"other": [1, 2, 3], "more": [1]})
+
+
+def test_evaluate_batch_raises_when_row_unmatched() -> None:
+    """Rows without a matching rule raise ``LookupError``."""
+
+    rs = ruleset(when(credit_score.between(700, 850)).then("top"))
+
+    with pytest.raises(LookupError, match="row 1"):
+        rs.evaluate_batch({"credit_score": [720.0, 600.0]})
+
+
+def test_numba_backend_matches_numpy_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The jit-compiled kernel agrees with mask evaluation on interval rulesets."""
+
+    pytest.importorskip("numba")
+    from unirules.engines import _numba_backend  # noqa: PLC0415
+
+    from .credit_scoring import build_high_income_ruleset  # noqa: PLC0415
+
+    rs = ruleset(
+        when(credit_score < 500, name="low").then("low"),
+        when(credit_score.between(500, 700) & ~(credit_score == 600), name="mid").then(build_high_income_ruleset()),
+        otherwise("rest"),
+    )
+    data = {"credit_score": [300.0, 499.0, 550.0, 600.0, 650.0, 700.0, 850.0]}
+
+    kernels: list[object] = []
+    compile_kernel = _numba_backend.compile_kernel
+
+    def counting_compile_kernel(ruleset: Any) -> Any:
+        kernels.append(ruleset)
+        return compile_kernel(ruleset)
+
+    monkeypatch.setattr(_numba_backend, "compile_kernel", counting_compile_kernel)
+
+    assert rs.evaluate_batch(data, backend="numba") == rs.evaluate_batch(data)
+    assert rs.evaluate_batch(data, backend="numba") == rs.evaluate_batch(data)
+    assert kernels == [rs]
+
+
+def test_numba_backend_rejects_discrete_conditions() -> None:
+    """Rulesets testing discrete fields cannot use the numba backend."""
+
+    pytest.importorskip("numba")
+
+    with pytest.raises(ValueError, match="interval"):
+        build_credit_scoring_ruleset().evaluate_batch({"credit_score": [700.0]}, backend="numba")
+
+
+def test_resolve_many_matches_resolve() -> None:
+    """Resolving contexts in bulk agrees with resolving them one by one."""
+
+    resolver = build_credit_scoring_ruleset().to_resolver()
+    ctxs = [
+        {"income_level": "HIGH", "credit_score": 750, "loan_purpose": "AUTO"},
+        {"income_level": "MEDIUM", "credit_score": 450, "loan_purpose": "MORTGAGE"},
+        {"income_level": "LOW", "credit_score": 550},
+        {"income_level": "HIGH"},
+    ]
+
+    assert resolver.resolve_many(ctxs) == [resolver.resolve(ctx) for ctx in ctxs]
+    assert resolver.resolve_many(iter(ctxs[:1])) == [LoanDecision(decision="APPROVE", rate=3.5)]
+    assert ruleset(otherwise("always")).to_resolver().resolve_many([{}, {}]) == ["always", "always"]
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        pytest.param({"income_level": None, "credit_score": 450}, id="discrete-none"),
+        pytest.param({"credit_score": math.nan}, id="interval-nan"),
+        pytest.param({"credit_score": None}, id="interval-none"),
+    ],
+)
+def test_resolve_many_rejects_values_resolve_rejects(row: dict[str, object]) -> None:
+    """Explicit ``None`` or ``NaN`` values are invalid, not missing, in batches too."""
+
+    resolver = build_credit_scoring_ruleset().to_resolver()
+    with pytest.raises(ValueError) as scalar:
+        resolver.resolve(row)
+    with pytest.raises(ValueError) as batch:
+        resolver.resolve_many([{"credit_score": 700.0}, row])
+    assert str(batch.value) == str(scalar.value)
+
+
+def test_discrete_columns_are_encoded_as_domain_codes() -> None:
+    """Discrete batch columns compare small integer codes, ``-1`` when missing."""
+
+    domain = DiscreteDomain({"web", "branch", "phone"})
+    channel = field("channel", domain)
+    ref = DiscreteFieldRef("channel", domain)
+    col = _discrete_column(ref, ["web", None, "phone"])
+
+    assert col.dtype == np.int8
+    assert col.tolist() == [domain.encode("web"), -1, domain.encode("phone")]
+    assert domain.decode(domain.encode("branch")) == "branch"
+    with pytest.raises(ValueError, match="channel"):
+        _discrete_column(ref, ["web", "fax"])
+
+    rs = ruleset(
+        when(channel.isin({"web", "phone"})).then("remote"),
+        when(channel.notin({"web"})).then("other"),
+    )
+    assert rs.evaluate_batch({"channel": ["phone", "branch", None]}) == ["remote", "other", "other"]
+
+
+def test_evaluate_batch_accepts_encoded_context_batch() -> None:
+    """A prebuilt :class:`ContextBatch` is evaluated without re-encoding."""
+
+    domain = DiscreteDomain({"web", "branch", "phone"})
+    channel = field("channel", domain)
+    rs = ruleset(
+        when(channel.isin({"web", "phone"}) & credit_score.gt(600)).then("remote"),
+        otherwise("other"),
+    )
+    batch = ContextBatch(
+        {
+            "channel": _discrete_column(DiscreteFieldRef("channel", domain), ["web", "branch", None]),
+            "credit_score": np.array([700.0, 700.0, 700.0]),
+        }
+    )
+
+    assert rs.evaluate_batch(batch) == ["remote", "other", "other"]
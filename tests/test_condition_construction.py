@@ -1,6 +1,13 @@
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from unirules.core.conditions import VISIT_METHODS, AlwaysTrue, And, Not, Or
+from unirules.domains.common.conditions import Eq
+from unirules.domains.discrete.conditions import In_, NotIn_
 from unirules.domains.discrete.domain import DiscreteDomain
+from unirules.domains.interval.conditions import Between, Ge, Gt, Le, Lt
 from unirules.domains.interval.domain import IntervalDomain
 from unirules.dsl import field
 
@@ -37,3 +44,57 @@ def test_discrete_membership_raises_when_item_not_in_domain() -> None:
 
     with pytest.raises(ValueError):
         income_level.isin(["LOW", "INVALID"])
+
+
+def test_condition_kinds_index_matching_visit_methods() -> None:
+    expected = {
+        Between: "visit_between",
+        Gt: "visit_gt",
+        Ge: "visit_ge",
+        Lt: "visit_lt",
+        Le: "visit_le",
+        Eq: "visit_eq",
+        In_: "visit_in",
+        NotIn_: "visit_notin",
+        And: "visit_and",
+        Or: "visit_or",
+        Not: "visit_not",
+        AlwaysTrue: "visit_always_true",
+    }
+
+    for cls, method in expected.items():
+        assert VISIT_METHODS[cls.KIND] == method
+
+
+def test_interval_conditions_evaluate_false_when_field_missing() -> None:
+    credit_score = field("credit_score", IntervalDomain(300, 850))
+
+    conditions = [
+        credit_score.between(400, 500),
+        credit_score.gt(400),
+        credit_score.ge(400),
+        credit_score.lt(500),
+        credit_score.le(500),
+    ]
+
+    for cond in conditions:
+        assert cond.eval({"other": 450.0}) is False
+        assert cond.eval({"credit_score": 450.0}) is True
+
+
+def test_conditions_are_slotted_and_survive_pickling() -> None:
+    credit_score = field("credit_score", IntervalDomain(300, 850))
+    status = field("status", DiscreteDomain({"A", "B"}))
+
+    between = credit_score.between(400, 500, closed="left")
+    conditions = [between, credit_score.gt(400), status == "A", ~(between & status.isin(["B"]))]
+
+    for cond in conditions:
+        assert not hasattr(cond, "__dict__")
+        restored = pickle.loads(pickle.dumps(cond))
+        for value in (400.0, 450.0):
+            ctx = {"credit_score": value, "status": "A"}
+            assert restored.eval(ctx) is cond.eval(ctx)
+
+    with pytest.raises(FrozenInstanceError):
+        between.lo = 0.0  # type: ignore[misc]
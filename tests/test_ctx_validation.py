@@ -2,10 +2,10 @@ from decimal import Decimal
 
 import pytest
 
-from unirules import field, ruleset, when
+from unirules import field, otherwise, ruleset, when
 from unirules.domains.discrete.domain import DiscreteDomain
 from unirules.domains.interval.domain import IntervalDomain
-from unirules.engines._ctx_validation import validate_context
+from unirules.engines._ctx_validation import MISSING, context_values, validate_context
 
 
 def test_validate_context_normalizes_numeric_values() -> None:
@@ -28,3 +28,92 @@ def test_validate_context_normalizes_numeric_values() -> None:
     assert normalized["status"] == "HIGH"
     # Original context remains untouched
     assert ctx["score"] == Decimal("75.5")
+
+
+@pytest.mark.parametrize("value", ["MEDIUM", ["HIGH"]])
+def test_validate_context_rejects_values_outside_discrete_domain(value: object) -> None:
+    """Unknown and unhashable discrete values are reported as not allowed."""
+
+    status = field("status", DiscreteDomain({"LOW", "HIGH"}))
+    rs = ruleset(when(status == "HIGH").then("status"))
+
+    with pytest.raises(ValueError, match="is not allowed"):
+        validate_context(rs, {"status": value})
+
+
+def test_validate_context_returns_normalized_context_unchanged() -> None:
+    """No copy is made when every value is already in normalized form."""
+
+    score = field("score", IntervalDomain(0, 100))
+    status = field("status", DiscreteDomain({"LOW", "HIGH"}))
+    rs = ruleset(when(score.gt(50) & (status == "HIGH")).then("high"))
+
+    ctx = {"score": 75.5, "status": "HIGH", "unrelated": object()}
+
+    assert validate_context(rs, ctx) is ctx
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), "abc", None])
+def test_validate_context_rejects_non_numeric_interval_values(value: object) -> None:
+    """Interval values must be finite numbers."""
+
+    score = field("score", IntervalDomain(0, 100))
+    rs = ruleset(when(score.gt(50)).then("high"))
+
+    with pytest.raises(ValueError, match="is not numeric"):
+        validate_context(rs, {"score": value})
+
+
+@pytest.mark.parametrize("value", [-0.5, 100.5])
+def test_validate_context_rejects_floats_outside_domain(value: float) -> None:
+    """Float values skip conversion but are still range checked."""
+
+    score = field("score", IntervalDomain(0, 100))
+    rs = ruleset(when(score.gt(50)).then("high"))
+
+    with pytest.raises(ValueError, match="outside of allowed range"):
+        validate_context(rs, {"score": value})
+
+
+def test_validate_context_checks_discrete_only_rulesets_in_place() -> None:
+    """Rule sets without coercing fields validate without building a new mapping."""
+
+    status = field("status", DiscreteDomain({"LOW", "HIGH"}))
+    rs = ruleset(when(status == "HIGH").then("status"))
+    ctx = {"status": "LOW", "other": 1}
+
+    assert not rs._needs_normalization
+    assert validate_context(rs, ctx) is ctx
+    with pytest.raises(ValueError, match="is not allowed"):
+        validate_context(rs, {"status": "MEDIUM"})
+
+
+def test_context_values_are_ordered_by_field_index() -> None:
+    """Context values come back normalized, in field order, with gaps marked."""
+
+    score = field("score", IntervalDomain(0, 100))
+    status = field("status", DiscreteDomain({"LOW", "HIGH"}))
+    rs = ruleset(
+        when(score.gt(50)).then("high"),
+        when(status == "HIGH").then("status"),
+    )
+
+    assert [ref.name for ref in rs.iter_field_refs()] == ["score", "status"]
+    assert context_values(rs, {"status": "LOW", "score": Decimal("60")}) == [60.0, "LOW"]
+    assert context_values(rs, {"status": "LOW"}) == [MISSING, "LOW"]
+    assert context_values(rs, {}) == [MISSING, MISSING]
+    with pytest.raises(ValueError, match="status"):
+        context_values(rs, {"status": "MEDIUM"})
+
+
+def test_context_values_handle_any_field_names_and_counts() -> None:
+    """Value extraction works for odd field names, one field and no fields."""
+
+    quoted = field("it's odd", IntervalDomain(0, 10))
+    single = ruleset(when(quoted.lt(5)).then("low"), otherwise("high"))
+    assert context_values(single, {"it's odd": 3}) == [3.0]
+    assert context_values(single, {"other": 3}) == [MISSING]
+
+    empty = ruleset(otherwise("any"))
+    assert context_values(empty, {"other": 3}) == []
+    assert empty.to_resolver().resolve({"other": 3}) == "any"
@@ -1,11 +1,12 @@
+import pickle
 from collections.abc import Mapping
 from typing import Any
 
 import pytest
 
-from unirules import ruleset, when
+from unirules import Explanation, RuleSetPolicy, ruleset, when
 
-from .credit_scoring import LoanDecision, build_credit_scoring_ruleset, income_level
+from .credit_scoring import LoanDecision, build_credit_scoring_ruleset, income_level, loan_purpose
 
 
 @pytest.fixture
@@ -83,3 +84,41 @@ def test_explain_no_match_returns_empty_result(credit_scoring_ruleset) -> None:
     assert explanation.result is None
     assert explanation.path == []
     assert explanation.tested == ["High income: ×"]
+
+
+def test_explain_follows_priority_and_compound_conditions() -> None:
+    """Explain tests rules in priority order and honours ``|`` and ``~``."""
+
+    resolver = ruleset(
+        when(~(income_level == "HIGH"), name="Not high", priority=0).then("N"),
+        when((income_level == "HIGH") | (loan_purpose == "AUTO"), name="High or auto", priority=5).then("H"),
+        policy=RuleSetPolicy.PRIORITY,
+    ).to_resolver()
+
+    explanation = resolver.explain({"income_level": "LOW", "loan_purpose": "MORTGAGE"})
+
+    assert explanation.matched_rule == "Not high"
+    assert explanation.tested == ["High or auto: ×", "Not high: ✓"]
+    assert explanation.result == "N"
+    assert resolver.explain({"loan_purpose": "AUTO"}).result == "H"
+
+
+def test_explain_formats_tested_rules_on_first_access(credit_scoring_resolver) -> None:
+    """Outcomes are recorded raw and rendered once, when ``tested`` is read."""
+
+    explanation = credit_scoring_resolver.explain({"income_level": "LOW", "credit_score": 450})
+
+    assert explanation.tested is explanation.tested
+    assert explanation.tested[:2] == ["High income: ×", "Medium mortgage: ×"]
+    assert explanation.tested[-1] == "Low credit reject: ✓"
+    assert pickle.loads(pickle.dumps(explanation)) == explanation
+
+    copy = Explanation(
+        matched_rule=explanation.matched_rule,
+        path=explanation.path,
+        tested=list(explanation.tested),
+        result=explanation.result,
+    )
+    assert copy == explanation
+    assert repr(copy) == repr(explanation)
+    assert "tested=[" in repr(explanation)
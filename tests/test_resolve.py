@@ -1,12 +1,20 @@
+import ast
+import pickle
 from collections.abc import Mapping
 from typing import Any
 
 import pytest
 
-from unirules import RuleSetPolicy, field, ruleset, when
+from unirules import ContextRecord, RuleSetPolicy, field, otherwise, ruleset, when
+from unirules.core.conditions import AlwaysTrue, Not
 from unirules.domains.discrete.domain import DiscreteDomain
+from unirules.domains.interval.domain import IntervalDomain
+from unirules.engines import resolver as resolver_module
+from unirules.engines._codegen import build_resolver_ast, predicate_compiler
+from unirules.engines._ctx_validation import MISSING
+from unirules.engines._optimize import FALSE, fold
 
-from .credit_scoring import LoanDecision, credit_score
+from .credit_scoring import LoanDecision, build_credit_scoring_ruleset, credit_score, income_level
 
 
 @pytest.mark.parametrize(
@@ -182,3 +190,286 @@ def test_ruleset_rejects_unknown_policy() -> None:
 
     with pytest.raises(ValueError, match="Unsupported ruleset policy"):
         ruleset(when(status == "VIP").then("vip"), policy="unknown")
+
+
+@pytest.mark.parametrize("policy", ["priority", "PRIORITY", "Priority", RuleSetPolicy.PRIORITY])
+def test_ruleset_policy_strings_are_case_insensitive(policy: str) -> None:
+    """Policy names are normalized to the enum member once, at construction."""
+
+    status = field("status", DiscreteDomain({"VIP"}))
+
+    rs = ruleset(when(status == "VIP").then("vip"), policy=policy)
+
+    assert rs.policy is RuleSetPolicy.PRIORITY
+
+
+@pytest.mark.parametrize("closed", ["none", "left", "right", "both"])
+@pytest.mark.parametrize("value", [600, 650, 700])
+def test_compiled_between_matches_condition_eval(closed: str, value: float) -> None:
+    """Inlined interval conditions honour the same endpoints as ``Cond.eval``."""
+
+    cond = credit_score.between(600, 700, closed=closed)
+    resolver = ruleset(
+        when(cond).then("inside"),
+        when(credit_score >= 300).then("outside"),
+    ).to_resolver()
+
+    expected = "inside" if cond.eval({"credit_score": float(value)}) else "outside"
+    assert resolver.resolve({"credit_score": value}) == expected
+
+
+def test_indexed_between_rules_keep_first_match_semantics() -> None:
+    """A run of overlapping ``Between`` rules resolves like a linear scan."""
+
+    conds = [
+        credit_score.between(600, 700, closed="left"),
+        credit_score.between(650, 750, closed="both"),
+        credit_score.between(700, 700),
+        credit_score.between(300, 650, closed="right"),
+        credit_score.between(740, 850),
+    ]
+    resolver = ruleset(
+        *(when(cond).then(i) for i, cond in enumerate(conds)),
+        when(credit_score >= 300).then(None),
+    ).to_resolver()
+
+    for value in [300, 450, 599.5, 600, 620, 650, 675, 700, 720, 740, 750, 760, 850]:
+        ctx = {"credit_score": float(value)}
+        expected = next((i for i, cond in enumerate(conds) if cond.eval(ctx)), None)
+        assert resolver.resolve(ctx) == expected, value
+
+
+def test_resolver_ast_loads_payloads_from_table() -> None:
+    """The generated function returns payloads by index and unpacks fields once."""
+
+    func, namespace = build_resolver_ast(build_credit_scoring_ruleset())
+    source = ast.unparse(ast.fix_missing_locations(func))
+
+    assert isinstance(func, ast.FunctionDef)
+    assert "_v0, _v1, _v2 = values" in source
+    assert "_PAYLOADS[0]" in source
+    assert namespace["_PAYLOADS"][0] == LoanDecision(decision="APPROVE", rate=3.5)
+
+
+def test_ruleset_compile_is_cached() -> None:
+    """The generated resolve function is built once per ruleset."""
+
+    rs = ruleset(when(credit_score.between(700, 850)).then("top"))
+
+    assert rs.compile() is rs.compile()
+    assert rs.compile()({"credit_score": 720.0}) == "top"
+
+
+def test_resolvers_share_traversal_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolvers built from the same ruleset reuse its compiled structures."""
+
+    builds: list[str] = []
+
+    def counting(name: str, build: Any) -> Any:
+        def wrapper(ruleset: Any) -> Any:
+            builds.append(name)
+            return build(ruleset)
+
+        return wrapper
+
+    monkeypatch.setattr(resolver_module, "compile_ruleset", counting("resolve", resolver_module.compile_ruleset))
+    monkeypatch.setattr(resolver_module, "compile_program", counting("program", resolver_module.compile_program))
+    rs = ruleset(when(credit_score.between(700, 850)).then("top"))
+
+    first, second = rs.to_resolver(), rs.to_resolver()
+
+    assert second.resolve({"credit_score": 720.0}) == "top"
+    assert builds == ["resolve"]
+    assert first.explain({"credit_score": 720.0}) == second.explain({"credit_score": 720.0})
+    assert builds == ["resolve", "program"]
+
+
+def test_resolver_cache_reuses_results_for_equal_contexts() -> None:
+    """With ``cache_size`` set, equal hashable contexts skip re-resolution."""
+
+    class Score:
+        conversions = 0
+
+        def __float__(self) -> float:
+            Score.conversions += 1
+            return 720.0
+
+    score = Score()
+    rs = ruleset(when(credit_score.between(700, 850)).then(["top"]))
+    resolver = rs.to_resolver(cache_size=8)
+
+    assert resolver.resolve({"credit_score": score}) == ["top"]
+    assert resolver.resolve({"credit_score": score}) == ["top"]
+    assert Score.conversions == 1
+    assert rs.to_resolver().resolve({"credit_score": score}) == ["top"]
+    assert Score.conversions == 2
+    assert resolver.resolve({"credit_score": 720, "tags": ["x"]}) == ["top"]
+    with pytest.raises(ValueError, match="outside of allowed range"):
+        resolver.resolve({"credit_score": 1000})
+
+
+def test_predicates_take_field_values_positionally() -> None:
+    """Compiled rule predicates read values by field index and handle gaps."""
+
+    cond = (income_level == "HIGH") & credit_score.between(700, 850)
+    rs = ruleset(when(cond).then("top"))
+    predicate = predicate_compiler(rs)(cond)
+
+    assert [ref.name for ref in rs.iter_field_refs()] == ["income_level", "credit_score"]
+    assert predicate("HIGH", 720.0)
+    assert not predicate("LOW", 720.0)
+    assert not predicate("HIGH", MISSING)
+    assert predicate_compiler(rs)(~cond)(MISSING, MISSING)
+
+
+def test_priority_order_is_computed_at_construction() -> None:
+    """Priority rule sets store their stable evaluation order up front."""
+
+    rs = ruleset(
+        when(credit_score >= 300, priority=1).then("a"),
+        when(credit_score >= 400, priority=5).then("b"),
+        when(credit_score >= 500, priority=1).then("c"),
+        policy=RuleSetPolicy.PRIORITY,
+    )
+
+    assert [index for index, _ in rs._ordered] == [1, 0, 2]
+
+
+def test_indexed_comparison_rules_keep_first_match_semantics() -> None:
+    """Runs mixing ``Between`` with one-sided comparisons are indexed exactly."""
+
+    conds = [
+        credit_score < 450,
+        credit_score.between(450, 600, closed="right"),
+        credit_score <= 650,
+        credit_score > 800,
+        credit_score >= 650,
+    ]
+    resolver = ruleset(*(when(cond).then(i) for i, cond in enumerate(conds))).to_resolver()
+
+    for value in [300, 449.9, 450, 599, 600, 625, 650, 700, 800, 800.5, 850]:
+        ctx = {"credit_score": float(value)}
+        expected = next(i for i, cond in enumerate(conds) if cond.eval(ctx))
+        assert resolver.resolve(ctx) == expected, value
+    with pytest.raises(LookupError):
+        resolver.resolve({})
+
+
+def test_indexed_rules_resolve_large_magnitude_values() -> None:
+    """Values beyond the outermost bounds hit the right rule for huge domains."""
+
+    x = field("x", IntervalDomain(0, 1e20))
+    rs = ruleset(
+        when(x < 1e17).then("small"),
+        when(x.between(1e17, 2e17)).then("mid"),
+        when(x > 2e17).then("big"),
+        when(x >= 0).then("any"),
+    )
+    resolver = rs.to_resolver()
+
+    for value, expected in [(0.0, "small"), (1.5e17, "mid"), (2e17, "mid"), (3e19, "big"), (1e20, "big")]:
+        assert resolver.resolve({"x": value}) == expected, value
+        assert resolver.explain({"x": value}).result == expected, value
+
+
+def test_resolved_values_are_shared_rule_values() -> None:
+    """Resolution returns the rule's value object itself, never a copy."""
+
+    decision = LoanDecision(decision="APPROVE", rate=3.5)
+    rs = ruleset(
+        *(when(credit_score.between(lo, lo + 50)).then(f"band {lo}") for lo in range(300, 700, 50)),
+        when(credit_score >= 700).then(decision),
+    )
+    resolver = rs.to_resolver(cache_size=4)
+
+    assert resolver.resolve({"credit_score": 720}) is decision
+    assert resolver.resolve({"credit_score": 720}) is decision
+    assert resolver.explain({"credit_score": 800}).result is decision
+    assert rs.compile()({"credit_score": 355.0}) is rs.rules[1].value
+
+
+def test_rules_rulesets_and_explanations_are_slotted() -> None:
+    """Rule containers and explanations carry no per-instance ``__dict__``."""
+
+    leaf = when(credit_score >= 700, name="top").then("top")
+    tree = when(credit_score >= 300, name="any").then(ruleset(leaf, otherwise("rest")))
+    rs = ruleset(tree)
+    explanation = rs.to_resolver().explain({"credit_score": 720})
+
+    for obj in (leaf, tree, rs, explanation):
+        assert not hasattr(obj, "__dict__")
+    assert explanation.path == ["any", "top"]
+    assert pickle.loads(pickle.dumps(leaf)).name == "top"
+
+
+def test_constant_conditions_are_folded_before_codegen() -> None:
+    """Statically decided conditions are folded away without changing results."""
+
+    status = field("status", DiscreteDomain({"VIP", "STD"}))
+    vip = status == "VIP"
+
+    assert fold(vip & AlwaysTrue()) is vip
+    assert fold(vip | ~AlwaysTrue()) is vip
+    assert fold(~~vip) is vip
+    assert fold(status.isin([]) & vip) is FALSE
+    assert isinstance(fold(credit_score.gt(850) | ~status.notin([])), Not)
+    assert isinstance(fold(vip | status.notin([])), AlwaysTrue)
+
+    rs = ruleset(
+        when(credit_score > 850, name="never").then("never"),
+        when(vip, name="vip").then("vip"),
+        when(vip | AlwaysTrue(), name="always").then("always"),
+        when(credit_score >= 300, name="dead").then("dead"),
+    )
+    source = ast.unparse(ast.fix_missing_locations(build_resolver_ast(rs)[0]))
+    resolver = rs.to_resolver()
+
+    assert "LookupError" not in source
+    assert "850" not in source
+    assert resolver.resolve({"status": "VIP"}) == "vip"
+    assert resolver.resolve({"credit_score": 900 - 50}) == "always"
+    assert resolver.explain({}).tested == ["never: ×", "vip: ×", "always: ✓"]
+
+
+def test_context_class_records_resolve_like_dicts() -> None:
+    """Slotted record contexts resolve and explain like mapping contexts."""
+
+    rs = build_credit_scoring_ruleset()
+    resolver = rs.to_resolver(cache_size=8)
+    Context = resolver.context_class()
+
+    record = Context(income_level="HIGH", credit_score=720)
+    partial = Context(income_level="LOW")
+
+    assert rs.to_resolver().context_class() is Context
+    assert Context.fields == ("income_level", "credit_score", "loan_purpose")
+    assert not hasattr(record, "__dict__")
+    assert resolver.resolve(record) == resolver.resolve({"income_level": "HIGH", "credit_score": 720})
+    assert resolver.explain(partial).path == resolver.explain({"income_level": "LOW"}).path
+    assert repr(partial) == "Context(income_level='LOW')"
+    assert isinstance(record, ContextRecord)
+    loaded = pickle.loads(pickle.dumps(partial))
+    assert type(loaded) is Context
+    assert repr(loaded) == repr(partial)
+    with pytest.raises(TypeError, match="unexpected field"):
+        Context(unknown=1)
+    with pytest.raises(ValueError, match="credit_score"):
+        resolver.resolve(Context(credit_score=900))
+
+
+def test_used_ruleset_pickles_without_compiled_code() -> None:
+    """Pickling drops cached generated code and rebuilds it after loading."""
+
+    rs = build_credit_scoring_ruleset()
+    ctx = {"income_level": "LOW", "credit_score": 450.0}
+    resolver = rs.to_resolver()
+    expected = resolver.resolve(ctx)
+    resolver.explain(ctx)
+    rs.compile()
+
+    loaded = pickle.loads(pickle.dumps(rs))
+
+    assert [rule.name for rule in loaded.rules] == [rule.name for rule in rs.rules]
+    assert loaded.policy is rs.policy
+    assert loaded.to_resolver().resolve(ctx) == expected
+    assert loaded.to_resolver().explain(ctx) == resolver.explain(ctx)